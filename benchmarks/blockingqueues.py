@@ -0,0 +1,75 @@
+"""Throughput of BlockingPriorityQueue and AsyncPriorityQueue
+
+Items per second are reported for several producer and consumer counts,
+with consumers draining the queue through get_batch.
+
+Run from the repository root:
+    python -m benchmarks.blockingqueues [items] [batch-size]
+"""
+import asyncio
+import sys
+import threading
+from random import Random
+from time import perf_counter
+from priorityQueues.blockingQueue import AsyncPriorityQueue, BlockingPriorityQueue
+
+COUNTS = ((1, 1), (1, 4), (4, 1), (4, 4), (8, 8))
+
+def thread_throughput(items, producers, consumers, batch, maxsize=1000):
+    pq = BlockingPriorityQueue(maxsize)
+    share = items // producers
+    received = [0] * consumers
+    def produce(seed):
+        rnd = Random(seed)
+        for j in range(share):
+            pq.put(rnd.randrange(1000), j)
+    def consume(c):
+        while True:
+            got = pq.get_batch(batch, timeout=0.1)
+            if not got and done.is_set():
+                return
+            received[c] += len(got)
+    done = threading.Event()
+    workers = [threading.Thread(target=produce, args=(p,)) for p in range(producers)]
+    drains = [threading.Thread(target=consume, args=(c,)) for c in range(consumers)]
+    start = perf_counter()
+    for t in workers + drains:
+        t.start()
+    for t in workers:
+        t.join()
+    done.set()
+    for t in drains:
+        t.join()
+    elapsed = perf_counter() - start
+    assert sum(received) == share * producers
+    return sum(received) / elapsed
+
+async def async_throughput(items, producers, consumers, batch, maxsize=1000):
+    pq = AsyncPriorityQueue(maxsize)
+    share = items // producers
+    received = [0] * consumers
+    async def produce(seed):
+        rnd = Random(seed)
+        for j in range(share):
+            await pq.put(rnd.randrange(1000), j)
+    async def consume(c):
+        while True:
+            got = await pq.get_batch(batch, timeout=0.1)
+            if not got and producing.done():
+                return
+            received[c] += len(got)
+    start = perf_counter()
+    producing = asyncio.gather(*(produce(p) for p in range(producers)))
+    await asyncio.gather(producing, *(consume(c) for c in range(consumers)))
+    elapsed = perf_counter() - start
+    assert sum(received) == share * producers
+    return sum(received) / elapsed
+
+if __name__ == '__main__':
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    batch = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    for producers, consumers in COUNTS:
+        threaded = thread_throughput(items, producers, consumers, batch)
+        awaited = asyncio.run(async_throughput(items, producers, consumers, batch))
+        print('%d producers %d consumers: threads %10.0f items/s  asyncio %10.0f items/s'
+              % (producers, consumers, threaded, awaited))
@@ -0,0 +1,58 @@
+"""Memory and throughput of BPlusTreeMap against the binary TreeMaps
+
+Run from the repository root:
+    python -m benchmarks.bplustree [keys] [fanout]
+"""
+import sys
+import tracemalloc
+from random import Random
+from time import perf_counter
+from searchTrees.bplustree import BPlusTreeMap
+from searchTrees.treemap import AVLTreeMap, RedBlackTreeMap, SplayTreeMap
+
+def timed(func):
+    start = perf_counter()
+    func()
+    return perf_counter() - start
+
+def traced_build(build):
+    """Return (map, bytes still allocated, seconds) for calling build
+    Everything build reads must be created before it is called"""
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    start = perf_counter()
+    m = build()
+    elapsed = perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    return m, memory, elapsed
+
+def measure(name, factory, keys, probes):
+    def insert():
+        m = factory()
+        for k in keys:
+            m[k] = k
+        return m
+    m, memory, insert_time = traced_build(insert)
+    def lookup():
+        for k in probes:
+            m[k]
+    def scan():
+        for k in probes[:100]:
+            m.items_between(k, k + 1000)
+    print('%-14s %8.1f bytes/key  insert %7.3fs  lookup %7.3fs  scan %7.3fs'
+          % (name, memory / len(keys), insert_time, timed(lookup), timed(scan)))
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    fanout = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    rnd = Random(1)
+    keys = list(range(n))
+    rnd.shuffle(keys)
+    probes = [rnd.randrange(n) for _ in range(n)]
+    for name, cls in (('AVL', AVLTreeMap), ('red-black', RedBlackTreeMap), ('splay', SplayTreeMap)):
+        measure(name, cls, keys, probes)
+    measure('B+ tree', lambda: BPlusTreeMap(fanout), keys, probes)
+    items = [(k, k) for k in range(n)]
+    bulk, memory, elapsed = traced_build(lambda: BPlusTreeMap.from_sorted(items, fanout))
+    print('B+ from_sorted %8.1f bytes/key  build  %7.3fs' % (memory / n, elapsed))
@@ -0,0 +1,83 @@
+"""Replay Dijkstra priority-queue traces against adaptable queue backends
+
+A trace of add, update and remove_min calls is recorded from a real
+shortest_path_lengths run and then replayed against each backend.
+
+Run from the repository root:
+    python -m benchmarks.dijkstratrace [vertices] [edges-per-vertex]
+"""
+import sys
+from time import perf_counter
+from graph.graph import TraversalStats, shortest_path_lengths
+from priorityQueues.priorityQueue import AdaptableHeapPriorityQueue
+from priorityQueues.priorityQueue import DaryHeapPriorityQueue
+from priorityQueues.priorityQueue import PairingHeapPriorityQueue
+from benchmarks.shortestpaths import random_graph
+
+class TraceRecorder(TraversalStats):
+    """TraversalStats whose queue proxy records every operation"""
+
+    def __init__(self):
+        super().__init__()
+        self.trace = []
+
+    def queue(self, pq):
+        return RecordingQueue(pq, self.trace)
+
+class RecordingQueue:
+    """Priority queue proxy appending (operation, locator id, key) to trace"""
+
+    def __init__(self, pq, trace):
+        self.pq = pq
+        self.trace = trace
+        self.ids = {}
+
+    def __len__(self):
+        return len(self.pq)
+
+    def is_empty(self):
+        return self.pq.is_empty()
+
+    def add(self, key, value):
+        loc = self.pq.add(key, value)
+        self.ids[id(loc)] = len(self.ids)
+        self.trace.append(('add', self.ids[id(loc)], key))
+        return loc
+
+    def update(self, loc, newkey, newval):
+        self.trace.append(('update', self.ids[id(loc)], newkey))
+        return self.pq.update(loc, newkey, newval)
+
+    def remove_min(self):
+        self.trace.append(('remove_min', None, None))
+        return self.pq.remove_min()
+
+def record_trace(n, degree):
+    g, s = random_graph(n, degree)
+    recorder = TraceRecorder()
+    shortest_path_lengths(g, s, stats=recorder)
+    return recorder.trace
+
+def replay(pq, trace):
+    """Replay trace against pq and return the elapsed seconds"""
+    locators = []
+    start = perf_counter()
+    for op, i, key in trace:
+        if op == 'remove_min':
+            pq.remove_min()
+        elif op == 'update':
+            pq.update(locators[i], key, i)
+        else:
+            locators.append(pq.add(key, i))
+    return perf_counter() - start
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**5
+    degree = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    trace = record_trace(n, degree)
+    print('operations', len(trace))
+    backends = [('binary', AdaptableHeapPriorityQueue)]
+    backends += [('%d-ary' % d, lambda d=d: DaryHeapPriorityQueue(d)) for d in (2, 4, 8)]
+    backends.append(('pairing', PairingHeapPriorityQueue))
+    for name, factory in backends:
+        print('%-8s %8.3fs' % (name, replay(factory(), trace)))
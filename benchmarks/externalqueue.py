@@ -0,0 +1,31 @@
+"""Throughput of ExternalPriorityQueue against the in-memory HeapPriorityQueue
+
+Run from the repository root:
+    python -m benchmarks.externalqueue [items] [memory-limit]
+"""
+import sys
+from random import Random
+from time import perf_counter
+from priorityQueues.priorityQueue import HeapPriorityQueue
+from priorityQueues.externalQueue import ExternalPriorityQueue
+
+def simulate(pq, items, seed=1):
+    """Add items events, removing one for every two added, then drain"""
+    rnd = Random(seed)
+    start = perf_counter()
+    for j in range(items):
+        pq.add(rnd.random(), j)
+        if j % 2:
+            pq.remove_min()
+    while not pq.is_empty():
+        pq.remove_min()
+    return items / (perf_counter() - start)
+
+if __name__ == '__main__':
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    limit = int(sys.argv[2]) if len(sys.argv) > 2 else items // 10
+    print('in-memory heap            %10.0f items/s' % simulate(HeapPriorityQueue(), items))
+    with ExternalPriorityQueue(memory_limit=items) as pq:
+        print('external, fits in memory  %10.0f items/s' % simulate(pq, items))
+    with ExternalPriorityQueue(memory_limit=limit) as pq:
+        print('external, limit %-9d %10.0f items/s' % (limit, simulate(pq, items)))
@@ -0,0 +1,50 @@
+"""Lookups from the root versus finger search on sorted, near-sorted and
+random query streams
+
+Run from the repository root:
+    python -m benchmarks.fingersearch [keys] [queries]
+"""
+import sys
+from random import Random
+from time import perf_counter
+from searchTrees.treemap import AVLTreeMap, RedBlackTreeMap
+
+def streams(n, count, rnd):
+    """Return (name, queries) pairs of count queries over keys 0..n-1
+    The sorted stream covers at most n distinct keys"""
+    count = min(count, n)
+    start = rnd.randrange(n - count + 1)
+    ordered = list(range(start, start + count))
+    near = [max(0, min(n - 1, k + rnd.randint(-16, 16))) for k in ordered]
+    scattered = [rnd.randrange(n) for _ in range(count)]
+    return [('sorted', ordered), ('near-sorted', near), ('random', scattered)]
+
+def lookups(m, queries):
+    begin = perf_counter()
+    for k in queries:
+        m[k]
+    return len(queries) / (perf_counter() - begin)
+
+def cursor_seeks(m, queries):
+    cursor = m.cursor()
+    begin = perf_counter()
+    for k in queries:
+        cursor.seek(k)
+    return len(queries) / (perf_counter() - begin)
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    if n < 1 or count < 1:
+        sys.exit('usage: python -m benchmarks.fingersearch [keys >= 1] [queries >= 1]')
+    rnd = Random(1)
+    for cls in (AVLTreeMap, RedBlackTreeMap):
+        m = cls.from_sorted((k, k) for k in range(n))
+        for name, queries in streams(n, count, rnd):
+            m.finger_search = False
+            plain = lookups(m, queries)
+            m.finger_search = True
+            finger = lookups(m, queries)
+            seeks = cursor_seeks(m, queries)
+            print('%-16s %-12s root %10.0f/s   finger %10.0f/s   cursor seek %10.0f/s'
+                  % (cls.__name__, name, plain, finger, seeks))
@@ -0,0 +1,47 @@
+"""Measure bytes per vertex and per edge for Graph and CompactGraph
+
+Run from the repository root:
+    python -m benchmarks.graphmemory [vertices] [edges-per-vertex]
+"""
+import sys
+import tracemalloc
+from random import Random
+from graph.graph import Graph, CompactGraph
+
+def random_pairs(n, degree, seed=1):
+    """Return a sorted list of degree*n distinct (u, v) index pairs"""
+    rnd = Random(seed)
+    pairs = set()
+    while len(pairs) < degree * n:
+        u, v = rnd.randrange(n), rnd.randrange(n)
+        if u != v:
+            pairs.add((u, v))
+    return sorted(pairs)
+
+def traced(func):
+    """Return (result, bytes still allocated) for calling func"""
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    result = func()
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    return result, used
+
+def measure(cls, n, degree):
+    """Return (bytes per vertex, bytes per edge) for graph class cls"""
+    pairs = random_pairs(n, degree)
+    g = cls(directed=True)
+    verts, vertex_bytes = traced(lambda: [g.insert_vertex(i) for i in range(n)])
+    vertex_bytes -= sys.getsizeof(verts)
+    def insert_edges():
+        for u, v in pairs:
+            g.insert_edge(verts[u], verts[v], 1)
+    edge_bytes = traced(insert_edges)[1]
+    return vertex_bytes / n, edge_bytes / len(pairs)
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**5
+    degree = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    for cls in (Graph, CompactGraph):
+        per_vertex, per_edge = measure(cls, n, degree)
+        print('%-12s %8.1f bytes/vertex %8.1f bytes/edge' % (cls.__name__, per_vertex, per_edge))
@@ -0,0 +1,51 @@
+"""Overlap and stabbing queries: IntervalTreeMap versus a linear scan
+
+Run from the repository root:
+    python -m benchmarks.intervaltree [intervals] [queries] [max-length]
+"""
+import sys
+from random import Random
+from time import perf_counter
+from searchTrees.intervaltree import IntervalTreeMap
+
+def scan_overlapping(intervals, start, stop):
+    return [(key, value) for key, value in intervals if key[0] < stop and start < key[1]]
+
+def scan_stabbing(intervals, x):
+    return [(key, value) for key, value in intervals if key[0] <= x < key[1]]
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    length = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+    rnd = Random(1)
+    span = 100 * n
+    tree = IntervalTreeMap()
+    for j in range(n):
+        start = rnd.randrange(span)
+        tree.insert(start, start + rnd.randint(1, length), j)
+    intervals = tree.items_between(None, None)
+    ranges = []
+    for _ in range(queries):
+        start = rnd.randrange(span)
+        ranges.append((start, start + rnd.randint(1, 10 * length)))
+    points = [rnd.randrange(span) for _ in range(queries)]
+    cases = [
+        ('overlapping', lambda: [tree.overlapping(a, b) for a, b in ranges],
+                        lambda: [scan_overlapping(intervals, a, b) for a, b in ranges]),
+        ('overlapping_batch', lambda: tree.overlapping_batch(ranges), None),
+        ('stabbing', lambda: [tree.stabbing(x) for x in points],
+                     lambda: [scan_stabbing(intervals, x) for x in points]),
+        ('stabbing_batch', lambda: tree.stabbing_batch(points), None),
+    ]
+    for name, indexed, scan in cases:
+        begin = perf_counter()
+        found = indexed()
+        elapsed = perf_counter() - begin
+        line = '%-18s tree %9.1f us/query' % (name, 1e6 * elapsed / queries)
+        if scan is not None:
+            begin = perf_counter()
+            if scan() != found:
+                raise AssertionError('results differ from linear scan')
+            line += '   scan %9.1f us/query' % (1e6 * (perf_counter() - begin) / queries)
+        print(line + '   %d hits' % sum(len(hits) for hits in found))
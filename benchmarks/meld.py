@@ -0,0 +1,54 @@
+"""Combine sharded priority queues by meld versus repeated re-insertion
+
+Each round fills several shard queues, combines them into one and drains
+part of the result, as sharded workers do when handing off work.
+
+Run from the repository root:
+    python -m benchmarks.meld [items-per-shard] [shards] [rounds]
+"""
+import sys
+from random import Random
+from time import perf_counter
+from priorityQueues.priorityQueue import HeapPriorityQueue
+from priorityQueues.priorityQueue import LeftistHeapPriorityQueue
+from priorityQueues.priorityQueue import PairingHeapPriorityQueue
+from priorityQueues.priorityQueue import SkewHeapPriorityQueue
+
+def reinsert(target, shard):
+    while not shard.is_empty():
+        key, value = shard.remove_min()
+        target.add(key, value)
+
+def meld(target, shard):
+    target.meld(shard)
+
+def workload(cls, combine, per_shard, shards, rounds, seed=1):
+    """Return seconds spent combining shards over all rounds"""
+    rnd = Random(seed)
+    total = 0.0
+    target = cls()
+    for _ in range(rounds):
+        parts = []
+        for _ in range(shards):
+            pq = cls()
+            for j in range(per_shard):
+                pq.add(rnd.random(), j)
+            parts.append(pq)
+        start = perf_counter()
+        for pq in parts:
+            combine(target, pq)
+        total += perf_counter() - start
+        for _ in range(per_shard):
+            target.remove_min()
+    return total
+
+if __name__ == '__main__':
+    per_shard = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    shards = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    rounds = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    cases = [('binary', HeapPriorityQueue, reinsert)]
+    cases += [('leftist', LeftistHeapPriorityQueue, meld), ('skew', SkewHeapPriorityQueue, meld),
+              ('pairing', PairingHeapPriorityQueue, meld)]
+    for name, cls, combine in cases:
+        seconds = workload(cls, combine, per_shard, shards, rounds)
+        print('%-8s %-9s %8.4fs' % (name, combine.__name__, seconds))
@@ -0,0 +1,58 @@
+"""Write throughput of PersistentTreeMap versus AVLTreeMap, and range scans
+of snapshots taken while a writer thread keeps updating the map
+
+Run from the repository root:
+    python -m benchmarks.persistentmap [keys] [snapshots]
+"""
+import sys
+import threading
+from random import Random
+from time import perf_counter
+from searchTrees.treemap import AVLTreeMap
+from searchTrees.persistentmap import PersistentTreeMap
+
+def write_rate(m, keys):
+    begin = perf_counter()
+    for k in keys:
+        m[k] = k
+    for k in keys[::2]:
+        del m[k]
+    return (len(keys) + len(keys[::2])) / (perf_counter() - begin)
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    snapshots = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    rnd = Random(1)
+    keys = list(range(n))
+    rnd.shuffle(keys)
+    for cls in (AVLTreeMap, PersistentTreeMap):
+        print('%-18s %10.0f writes/s' % (cls.__name__, write_rate(cls(), keys)))
+
+    m = PersistentTreeMap()
+    for k in keys:
+        m[k] = 0
+    done = threading.Event()
+    writes = [0]
+
+    def writer():
+        j = 0
+        while not done.is_set():
+            m[keys[j % n]] = j
+            j += 1
+        writes[0] = j
+
+    thread = threading.Thread(target=writer)
+    begin = perf_counter()
+    thread.start()
+    scanned = 0
+    for _ in range(snapshots):
+        view = m.snapshot()
+        items = view.items_between(None, None)
+        if len(items) != len(view):
+            raise AssertionError('snapshot changed while it was read')
+        scanned += len(items)
+    done.set()
+    thread.join()
+    elapsed = perf_counter() - begin
+    print('%d snapshot scans of %d keys: %.0f keys/s read while %.0f writes/s ran concurrently'
+          % (snapshots, n, scanned / elapsed, writes[0] / elapsed))
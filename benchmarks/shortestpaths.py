@@ -0,0 +1,42 @@
+"""Compare shortest_path_lengths methods on random integer-weighted graphs
+
+Run from the repository root:
+    python -m benchmarks.shortestpaths [vertices] [edges-per-vertex]
+"""
+import sys
+from random import Random
+from time import perf_counter
+from graph.graph import Graph, shortest_path_lengths
+
+def random_graph(n, degree=4, max_weight=100, seed=1):
+    """Return (graph, source) for a connected random graph with n vertices"""
+    rnd = Random(seed)
+    g = Graph(directed=True)
+    verts = [g.insert_vertex(i) for i in range(n)]
+    for i in range(1, n):
+        g.insert_edge(verts[rnd.randrange(i)], verts[i], rnd.randint(1, max_weight))
+    for _ in range((degree - 1) * n):
+        u = verts[rnd.randrange(n)]
+        v = verts[rnd.randrange(n)]
+        if u is not v and g.get_edge(u, v) is None:
+            g.insert_edge(u, v, rnd.randint(1, max_weight))
+    return g, verts[0]
+
+def benchmark(n, degree=4):
+    g, s = random_graph(n, degree)
+    print('vertices', g.vertex_count(), 'edges', g.edge_count())
+    expected = None
+    for method in ('heap', 'radix', 'delta'):
+        start = perf_counter()
+        d = shortest_path_lengths(g, s, method=method)
+        elapsed = perf_counter() - start
+        if expected is None:
+            expected = d
+        elif d != expected:
+            raise AssertionError(method + ' disagrees with heap distances')
+        print('%-6s %8.2fs' % (method, elapsed))
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    degree = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    benchmark(n, degree)
@@ -0,0 +1,39 @@
+"""SkipListMap versus the balanced TreeMaps on sequential, random and
+Zipfian workloads: insertion, lookup and range-scan throughput
+
+Run from the repository root:
+    python -m benchmarks.skiplist [keys] [scan-length]
+"""
+import sys
+from time import perf_counter
+from searchTrees.treemap import AVLTreeMap, RedBlackTreeMap, SplayTreeMap
+from searchTrees.skiplist import SkipListMap
+from benchmarks.workloads import sequential_keys, uniform_keys, zipf_keys
+
+def rate(operation, count):
+    begin = perf_counter()
+    operation()
+    return count / (perf_counter() - begin)
+
+def run(cls, keys, length):
+    m = cls()
+    inserts = rate(lambda: [m.__setitem__(k, k) for k in keys], len(keys))
+    lookups = rate(lambda: [m.get(k) for k in keys], len(keys))
+    starts = keys[:200]
+    scans = rate(lambda: [m.items_between(k, k + length) for k in starts], len(starts))
+    return inserts, lookups, scans
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    length = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    workloads = [('sequential', sequential_keys(n)),
+                 ('random', uniform_keys(n, 10 * n)),
+                 ('zipfian', zipf_keys(n, n))]
+    bulk = sorted(set(workloads[1][1]))
+    print('%-10s %-16s %12s %12s %12s' % ('workload', 'map', 'inserts/s', 'lookups/s', 'scans/s'))
+    for name, keys in workloads:
+        for cls in (AVLTreeMap, RedBlackTreeMap, SplayTreeMap, SkipListMap):
+            print('%-10s %-16s %12.0f %12.0f %12.0f' % ((name, cls.__name__) + run(cls, keys, length)))
+    for cls in (AVLTreeMap, RedBlackTreeMap, SkipListMap):
+        print('%-16s from_sorted %12.0f items/s' % (cls.__name__,
+              rate(lambda: cls.from_sorted((k, k) for k in bulk), len(bulk))))
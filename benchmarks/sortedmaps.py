@@ -0,0 +1,145 @@
+"""Sorted-map benchmark suite: throughput, latency percentiles and peak
+memory of every sorted map implementation on reproducible workloads
+
+Run from the repository root:
+    python -m benchmarks.sortedmaps [operations] [output.json] [baseline.json]
+
+Results are written to output.json (default sortedmaps.json). If a baseline
+file from an earlier run is given, throughput changes are reported against
+it, with changes beyond REGRESSION marked.
+"""
+import gc
+import json
+import platform
+import sys
+import tracemalloc
+from time import perf_counter, perf_counter_ns
+from hashTables.maps import SortedTableMap
+from searchTrees.treemap import AVLTreeMap, RedBlackTreeMap, SplayTreeMap
+from searchTrees.skiplist import SkipListMap
+from searchTrees.bplustree import BPlusTreeMap
+from benchmarks.workloads import (sequential_keys, uniform_keys, zipf_keys, mixed_ops,
+                                  sliding_window_ops, scan_heavy_ops)
+
+MAPS = [AVLTreeMap, RedBlackTreeMap, SplayTreeMap, SortedTableMap, SkipListMap, BPlusTreeMap]
+REGRESSION = 0.10
+REPEATS = 3
+
+def workloads(n):
+    """Return a list of (name, keys to preload, operations)"""
+    universe = 4 * n
+    preload = uniform_keys(n, universe, seed=2)
+    return [
+        ('uniform', preload, mixed_ops(uniform_keys(n, universe, seed=3))),
+        ('zipfian', preload, mixed_ops(zipf_keys(n, universe, seed=4))),
+        ('sequential-insert', [], [('set', k) for k in sequential_keys(n)]),
+        ('sliding-window', [], sliding_window_ops(n, max(1, n // 10))),
+        ('range-scan', preload, scan_heavy_ops(max(1, n // 10), universe, 100)),
+    ]
+
+def apply(m, op):
+    """Perform one operation on map m"""
+    if op[0] == 'get':
+        m.get(op[1])
+    elif op[0] == 'set':
+        m[op[1]] = op[1]
+    elif op[0] == 'delete':
+        m.pop(op[1], None)
+    else:
+        for item in m.find_range(op[1], op[1] + op[2]):
+            pass
+
+def prepared(cls, preload):
+    m = cls()
+    for k in preload:
+        m[k] = k
+    return m
+
+def percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def throughput_run(cls, preload, ops):
+    """Return the elapsed seconds of one run, without per-operation timing"""
+    m = prepared(cls, preload)
+    gc.disable()
+    try:
+        begin = perf_counter()
+        for op in ops:
+            apply(m, op)
+        elapsed = perf_counter() - begin
+    finally:
+        gc.enable()
+    return elapsed
+
+def latency_run(cls, preload, ops):
+    """Return the sorted per-operation nanoseconds of one run"""
+    m = prepared(cls, preload)
+    latencies = []
+    clock = perf_counter_ns
+    gc.disable()
+    try:
+        for op in ops:
+            start = clock()
+            apply(m, op)
+            latencies.append(clock() - start)
+    finally:
+        gc.enable()
+    latencies.sort()
+    return latencies
+
+def measure(cls, preload, ops):
+    """Return a result dictionary for running ops on a preloaded map of type cls
+    Throughput is taken from the fastest of REPEATS uninstrumented runs and
+    latency percentiles from the instrumented run with the lowest median"""
+    elapsed = min(throughput_run(cls, preload, ops) for _ in range(REPEATS))
+    latencies = min((latency_run(cls, preload, ops) for _ in range(REPEATS)),
+                    key=lambda run: percentile(run, 0.50))
+    tracemalloc.start()
+    m = prepared(cls, preload)
+    for op in ops:
+        apply(m, op)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        'ops': len(ops),
+        'throughput': len(ops) / elapsed,
+        'p50_us': percentile(latencies, 0.50) / 1000,
+        'p90_us': percentile(latencies, 0.90) / 1000,
+        'p99_us': percentile(latencies, 0.99) / 1000,
+        'max_us': latencies[-1] / 1000,
+        'peak_kib': peak / 1024,
+    }
+
+def compare(results, baseline):
+    """Print throughput changes of results relative to the baseline results"""
+    before = {(r['workload'], r['map']): r for r in baseline['results']}
+    print('\nthroughput versus baseline:')
+    for r in results:
+        old = before.get((r['workload'], r['map']))
+        if old is None:
+            continue
+        change = r['throughput'] / old['throughput'] - 1
+        mark = '  REGRESSION' if change < -REGRESSION else ''
+        print('%-18s %-16s %+7.1f%%%s' % (r['workload'], r['map'], 100 * change, mark))
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    output = sys.argv[2] if len(sys.argv) > 2 else 'sortedmaps.json'
+    results = []
+    print('%-18s %-16s %12s %9s %9s %9s %10s' % ('workload', 'map', 'ops/s', 'p50 us', 'p99 us', 'max us', 'peak KiB'))
+    for name, preload, ops in workloads(n):
+        for cls in MAPS:
+            r = measure(cls, preload, ops)
+            r['workload'] = name
+            r['map'] = cls.__name__
+            results.append(r)
+            print('%-18s %-16s %12.0f %9.2f %9.2f %9.1f %10.0f' % (name, cls.__name__, r['throughput'],
+                  r['p50_us'], r['p99_us'], r['max_us'], r['peak_kib']))
+    report = {'python': platform.python_version(), 'platform': platform.platform(),
+              'operations': n, 'results': results}
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=1)
+    print('results written to', output)
+    if len(sys.argv) > 3:
+        with open(sys.argv[3]) as f:
+            compare(results, json.load(f))
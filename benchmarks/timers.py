@@ -0,0 +1,62 @@
+"""Timer churn on TimingWheel versus AdaptableHeapPriorityQueue
+
+Connection timeouts are scheduled, then repeatedly pushed back or
+cancelled and replaced while the clock advances.
+
+Run from the repository root:
+    python -m benchmarks.timers [timers] [operations]
+"""
+import sys
+from random import Random
+from time import perf_counter
+from priorityQueues.priorityQueue import AdaptableHeapPriorityQueue
+from priorityQueues.timingWheel import TimingWheel
+
+TIMEOUT = 30.0
+STEP = 0.001
+
+def wheel_churn(timers, operations, seed=1):
+    rnd = Random(seed)
+    wheel = TimingWheel(resolution=0.01)
+    handles = [wheel.schedule(TIMEOUT * rnd.random(), j) for j in range(timers)]
+    now = 0.0
+    start = perf_counter()
+    for op in range(operations):
+        j = rnd.randrange(timers)
+        if handles[j].is_active():
+            if op % 10 == 0:
+                wheel.cancel(handles[j])
+                handles[j] = wheel.schedule(now + TIMEOUT, j)
+            else:
+                wheel.reschedule(handles[j], now + TIMEOUT)
+        now += STEP
+        for when, k in wheel.advance(now):
+            handles[k] = wheel.schedule(now + TIMEOUT, k)
+    return perf_counter() - start
+
+def heap_churn(timers, operations, seed=1):
+    rnd = Random(seed)
+    pq = AdaptableHeapPriorityQueue()
+    handles = [pq.add(TIMEOUT * rnd.random(), j) for j in range(timers)]
+    active = [True] * timers
+    now = 0.0
+    start = perf_counter()
+    for op in range(operations):
+        j = rnd.randrange(timers)
+        if active[j]:
+            if op % 10 == 0:
+                pq.remove(handles[j])
+                handles[j] = pq.add(now + TIMEOUT, j)
+            else:
+                pq.update(handles[j], now + TIMEOUT, j)
+        now += STEP
+        while not pq.is_empty() and pq.min()[0] <= now:
+            when, k = pq.remove_min()
+            handles[k] = pq.add(now + TIMEOUT, k)
+    return perf_counter() - start
+
+if __name__ == '__main__':
+    timers = int(sys.argv[1]) if len(sys.argv) > 1 else 10**5
+    operations = int(sys.argv[2]) if len(sys.argv) > 2 else 10**5
+    print('timing wheel %8.3fs' % wheel_churn(timers, operations))
+    print('binary heap  %8.3fs' % heap_churn(timers, operations))
@@ -0,0 +1,49 @@
+"""Memory per element and traversal speed of the linked Tree versus the
+array-backed ArrayBinaryTree, for a complete binary tree
+
+Run from the repository root:
+    python -m benchmarks.treememory [elements]
+"""
+import sys
+import tracemalloc
+from time import perf_counter
+from trees.tree import Tree
+from trees.arrayTree import ArrayBinaryTree
+
+def linked_tree(elements):
+    t = Tree()
+    positions = []
+    for j, e in enumerate(elements):
+        if j == 0:
+            positions.append(t.add_root(e))
+        elif j % 2:
+            positions.append(t.add_left(positions[(j - 1) // 2], e))
+        else:
+            positions.append(t.add_right(positions[(j - 1) // 2], e))
+    return t
+
+def array_tree(elements):
+    return ArrayBinaryTree(elements)
+
+def traced_bytes(build, elements):
+    """Return the bytes still allocated by build(elements), excluding the elements"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tree = build(elements)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    elements = list(range(n))
+    for build in (linked_tree, array_tree):
+        used = traced_bytes(build, elements)
+        tree = build(elements)
+        timings = []
+        for name in ('preorder', 'inorder', 'postorder', 'breadthfirst'):
+            begin = perf_counter()
+            for e in getattr(tree, name)():
+                pass
+            timings.append('%s %.3fs' % (name, perf_counter() - begin))
+        print('%-12s %7.1f bytes/element   %s' % (build.__name__, used / n, '  '.join(timings)))
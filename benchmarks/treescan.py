@@ -0,0 +1,48 @@
+"""Range-scan throughput of TreeMap variants: Positions versus node cursors
+
+Run from the repository root:
+    python -m benchmarks.treescan [keys] [scan-length]
+"""
+import sys
+from random import Random
+from time import perf_counter
+from searchTrees.treemap import AVLTreeMap, RedBlackTreeMap, SplayTreeMap
+
+def position_scan(m, start, length):
+    """Scan with the Position API, as find_range used to"""
+    p = m.find_position(start)
+    if p.key() < start:
+        p = m.after(p)
+    count = 0
+    while p is not None and count < length:
+        count += 1
+        p = m.after(p)
+    return count
+
+def cursor_scan(m, start, length):
+    c = m.seek(start)
+    count = 0
+    while c.valid() and count < length:
+        count += 1
+        c.next()
+    return count
+
+def bulk_scan(m, start, length):
+    return len(m.items_between(start, start + length))
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    length = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    rnd = Random(1)
+    keys = list(range(n))
+    rnd.shuffle(keys)
+    for cls in (AVLTreeMap, RedBlackTreeMap, SplayTreeMap):
+        m = cls()
+        for k in keys:
+            m[k] = k
+        starts = [rnd.randrange(n - length) for _ in range(50)]
+        for scan in (position_scan, cursor_scan, bulk_scan):
+            begin = perf_counter()
+            scanned = sum(scan(m, s, length) for s in starts)
+            rate = scanned / (perf_counter() - begin)
+            print('%-16s %-14s %12.0f keys/s' % (cls.__name__, scan.__name__, rate))
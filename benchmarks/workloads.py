@@ -0,0 +1,55 @@
+"""Reproducible key streams shared by the sorted-map benchmarks"""
+from itertools import accumulate
+from random import Random
+
+def sequential_keys(count, start=0):
+    """Return the keys start, start+1, ... in increasing order"""
+    return list(range(start, start + count))
+
+def uniform_keys(count, universe, seed=1):
+    """Return count keys drawn uniformly from range(universe)"""
+    rnd = Random(seed)
+    return [rnd.randrange(universe) for _ in range(count)]
+
+def zipf_keys(count, universe, s=1.1, seed=1):
+    """Return count keys from range(universe) where the key of popularity
+    rank r is drawn with probability proportional to 1 / r**s
+
+    Popularity ranks are scattered over the key range by a fixed shuffle,
+    so hot keys are not all adjacent.
+    """
+    rnd = Random(seed)
+    weights = list(accumulate(1 / (r ** s) for r in range(1, universe + 1)))
+    keys = list(range(universe))
+    rnd.shuffle(keys)
+    return rnd.choices(keys, cum_weights=weights, k=count)
+
+def mixed_ops(keys, seed=1, lookups=0.5, inserts=0.25):
+    """Return ('get' | 'set' | 'delete', key) operations on the given keys
+    in the given proportions; the remaining operations are deletes"""
+    rnd = Random(seed)
+    ops = []
+    for k in keys:
+        r = rnd.random()
+        ops.append(('get' if r < lookups else 'set' if r < lookups + inserts else 'delete', k))
+    return ops
+
+def sliding_window_ops(count, window):
+    """Return operations inserting increasing timestamps and deleting each
+    one window inserts later, as for a time-ordered buffer"""
+    ops = []
+    for t in range(count):
+        ops.append(('set', t))
+        if t >= window:
+            ops.append(('delete', t - window))
+    return ops
+
+def scan_heavy_ops(count, universe, length, seed=1, scans=0.9):
+    """Return ('scan', start, length) range scans mixed with ('set', key)
+    inserts of uniformly random keys"""
+    rnd = Random(seed)
+    ops = []
+    for _ in range(count):
+        k = rnd.randrange(universe)
+        ops.append(('scan', k, length) if rnd.random() < scans else ('set', k))
+    return ops
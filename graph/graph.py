@@ -1,9 +1,14 @@
+from array import array
 from copy import deepcopy
+from time import perf_counter
 from priorityQueues.priorityQueue import AdaptableHeapPriorityQueue
 from priorityQueues.priorityQueue import HeapPriorityQueue
+from priorityQueues.priorityQueue import RadixHeap
 
 class Vertex:
     """Lightweight vertex structure for a graph"""
+    __slots__ = '_element'
+
     def __init__(self, x):
         """Do not call constructor directly. Use Graph's insert.vertex(x)"""
         self._element = x
@@ -17,6 +22,8 @@ class Vertex:
 
 class Edge:
     """Lightweight edge structure for a graph"""
+    __slots__ = 'origin', 'destination', '_element'
+
     def __init__(self, u, v, x):
         self.origin = u
         self.destination = v
@@ -34,11 +41,19 @@ class Edge:
         """Return element associated with this edge"""
         return self._element
 
-    def __hash__(self):
-        return hash((self.origin, self.destination))
+class CompactEdge(Edge):
+    """Edge record between the integer vertex ids of a CompactGraph"""
+    __slots__ = ()
+
+    def opposite(self, v):
+        """Return the vertex that is opposite v on this edge"""
+        return self.destination if v == self.origin else self.origin
 
 class Graph:
     """Representation of a simple graph using an adjacency map"""
+    Vertex = Vertex
+    Edge = Edge
+
     def __init__(self, directed=False):
         """Create an empty graph (undirected)
         Graph is directed if optional parameter is True
@@ -100,7 +115,179 @@ class Graph:
         e = self.Edge(u, v, x)
         self.outgoing[u][v] = e
         self.incoming[v][u] = e
+        return e
+
+class CompactGraph(Graph):
+    """Memory-lean graph whose vertices are the dense integers 0..n-1
+
+    Vertex elements are kept in a side table indexed by vertex id, and the
+    incident edges of each vertex are a plain list of slotted edge records,
+    so neither vertices nor adjacencies cost a dictionary. insert_edge
+    appends in O(1) time without looking for an existing edge from u to v;
+    get_edge, and insert_edge with replace=True, scan the list of u in
+    O(deg(u)) time.
+    """
+    Edge = CompactEdge
+
+    def __init__(self, directed=False):
+        """Create an empty graph (undirected)
+        Graph is directed if optional parameter is True
+        """
+        self.outgoing = []
+        self.incoming = [] if directed else self.outgoing
+        self.elements = []
+
+    def vertices(self):
+        """Return an iteration of all vertices of the graph"""
+        return range(len(self.outgoing))
+
+    def element(self, v):
+        """Return element associated with vertex v"""
+        return self.elements[v]
+
+    def edge_count(self):
+        """Return the number of edges in the graph"""
+        total = sum(len(adj) for adj in self.outgoing)
+        return total if self.is_directed() else total // 2
+
+    def edges(self):
+        """Return a set of all edges of the graph"""
+        result = set()
+        for adj in self.outgoing:
+            result.update(adj)
+        return result
+
+    def get_edge(self, u, v):
+        """Return the edge from u to v or None if not adjacent"""
+        for e in self.outgoing[u]:
+            if e.opposite(u) == v:
+                return e
+        return None
+
+    def incident_edges(self, v, outgoing=True):
+        """Return all (outgoing) edges incident to vertex v in the graph"""
+        adj = self.outgoing if outgoing else self.incoming
+        return iter(adj[v])
+
+    def insert_vertex(self, x=None):
+        """Insert element x and return the integer id of its new vertex"""
+        v = len(self.elements)
+        self.elements.append(x)
+        self.outgoing.append([])
+        if self.is_directed():
+            self.incoming.append([])
+        return v
+
+    def insert_edge(self, u, v, x=None, replace=False):
+        """Insert and return a new Edge from u to v with auxillary element x
+        If replace is True, an existing edge from u to v is replaced;
+        otherwise the caller must not insert the same edge twice
+        """
+        e = self.Edge(u, v, x)
+        old = self.get_edge(u, v) if replace else None
+        if old is not None:
+            out, into = self.outgoing[u], self.incoming[v]
+            out[out.index(old)] = e
+            if into is not out:
+                into[into.index(old)] = e
+        else:
+            self.outgoing[u].append(e)
+            if self.is_directed() or u != v:
+                self.incoming[v].append(e)
+        return e
+
+
+class TraversalStats:
+    """Counters and phase timings collected from instrumented graph algorithms
+
+    Pass an instance as the stats argument of BFS, shortest_path_lengths,
+    MST_PrimJarnik or MST_Kruskal. Algorithms given stats=None do no
+    bookkeeping at all. Every algorithm gives the shared counters the same
+    meaning: vertices_settled counts each vertex whose distance or tree edge
+    became final, and edges_relaxed counts each edge examined, once, even
+    though an undirected edge is scanned from both of its endpoints. When
+    used as a context manager, the optional callback is called with the
+    stats on exit.
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.counters = {}
+        self.peaks = {}
+        self.timings = {}
+        self.started = {}
+
+    def count(self, name, n=1):
+        """Add n to the counter with the given name"""
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def peak(self, name, size):
+        """Record size as the peak for name if it exceeds the previous one"""
+        if size > self.peaks.get(name, 0):
+            self.peaks[name] = size
+
+    def begin(self, phase):
+        """Start the wall clock for the given phase"""
+        self.started[phase] = perf_counter()
+
+    def end(self, phase):
+        """Stop the wall clock for the given phase and accumulate its time"""
+        elapsed = perf_counter() - self.started.pop(phase)
+        self.timings[phase] = self.timings.get(phase, 0.0) + elapsed
+
+    def queue(self, pq):
+        """Return pq wrapped so that its operations are counted"""
+        return CountingQueue(pq, self)
+
+    def report(self):
+        """Return a dictionary with all counters, peaks and timings"""
+        result = dict(self.counters)
+        for name, size in self.peaks.items():
+            result['peak_' + name] = size
+        for phase, elapsed in self.timings.items():
+            result['time_' + phase] = elapsed
+        return result
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.callback is not None:
+            self.callback(self)
+
+class CountingQueue:
+    """Priority queue proxy that records operations in a TraversalStats"""
+
+    def __init__(self, pq, stats):
+        self.pq = pq
+        self.stats = stats
 
+    def __len__(self):
+        return len(self.pq)
+
+    def is_empty(self):
+        return self.pq.is_empty()
+
+    def min(self):
+        return self.pq.min()
+
+    def add(self, key, value):
+        self.stats.count('pq_add')
+        result = self.pq.add(key, value)
+        self.stats.peak('queue_size', len(self.pq))
+        return result
+
+    def update(self, loc, newkey, newval):
+        self.stats.count('pq_update')
+        return self.pq.update(loc, newkey, newval)
+
+    def remove(self, loc):
+        self.stats.count('pq_remove')
+        return self.pq.remove(loc)
+
+    def remove_min(self):
+        self.stats.count('pq_remove_min')
+        return self.pq.remove_min()
 
 def DFS(g, u, discovered):
     """Perform DFS of the undiscovered portion of Graph g starting at Vertex u.
@@ -120,7 +307,7 @@ def construct_path(u, v, discovered):
     if v in discovered:
         path.append(v)
         walk = v
-        while walk is not u:
+        while walk != u:
             e = discovered[walk]
             parent = e.opposite(walk)
             path.append(parent)
@@ -139,23 +326,36 @@ def DFS_complete(g):
             DFS(g, u, forest)
     return forest
 
-def BFS(g, s, discovered):
+def BFS(g, s, discovered, stats=None):
     """Perform BFS of the undiscovered portion of Graph g starting at Vertex s.
 
     discovered is a dictionary mapping each vertex to the edge that was used to
     discover it during the BFS
     Newly discovered vertices will be added to the dictionary as a result
+    If stats is a TraversalStats, levels, vertices, edges and frontier sizes
+    are recorded in it
     """
+    if stats is not None:
+        stats.begin('search')
+        scans = 0
     level = [s]
     while len(level)>0:
+        if stats is not None:
+            stats.count('levels')
+            stats.count('vertices_settled', len(level))
+            scans += sum(g.degree(u) for u in level)
+            stats.peak('frontier_size', len(level))
         next_level = []
         for u in level:
             for e in g.incident_edges(u):
                 v = e.opposite(u)
                 if v not in discovered:
                     discovered[v] = e
-                    next_level.append(e)
+                    next_level.append(v)
         level = next_level
+    if stats is not None:
+        stats.end('search')
+        record_scans(g, scans, stats)
 
 def floyd_warshall(g):
     """Return a new graph that is the transitive closure of g"""
@@ -193,27 +393,51 @@ def topological_sort(g):
     return topo
 
 #Dijkstra
-def shortest_path_lengths(g, src):
+def shortest_path_lengths(g, src, method='heap', delta=None, stats=None,
+                          queue_factory=AdaptableHeapPriorityQueue):
     """Compute shortest-path distances from src to reachable vertices of g
     Graph g can be undirected or directed, but must be weighted such that
     e.element() returns a numeric weight for each edge e.
     Return dictionary mapping each reachable vertex to its distance from src
+
+    method selects the algorithm: 'heap' uses an adaptable binary heap,
+    'radix' a monotone radix heap and 'delta' delta-stepping with buckets
+    of width delta. 'radix' and 'delta' require non-negative integer weights
+    For 'heap', queue_factory is called to create the adaptable priority queue
+    If stats is a TraversalStats, search counters and timings are recorded in it
+    Raise ValueError if src is not a vertex of g
     """
+    if src not in g.vertices():
+        raise ValueError('src is not a vertex of g')
+    if method == 'radix':
+        return radix_shortest_path_lengths(g, src, stats)
+    elif method == 'delta':
+        return delta_stepping_path_lengths(g, src, delta, stats)
+    elif method != 'heap':
+        raise ValueError('Unknown shortest path method: ' + repr(method))
     d = {}
     cloud = {}
-    pq = AdaptableHeapPriorityQueue()
+    pq = queue_factory()
     pqlocator = {}
+    if stats is not None:
+        pq = stats.queue(pq)
+        stats.begin('initialize')
     # for each vertex v of the graph, add an entry to the priority, with
     # the source having distance 0 and all others having infinte distance
     for v in g.vertices():
-        if v in src:
+        if v == src:
             d[v] = 0
         else:
             d[v] = float('inf')
         pqlocator[v] = pq.add(d[v], v)
+    if stats is not None:
+        stats.end('initialize')
+        stats.begin('search')
 
     while not pq.is_empty():
         key, u = pq.remove_min()
+        if key == float('inf'):
+            break
         cloud[u] = key
         del pqlocator[u]
         for e in g.incident_edges(u):
@@ -223,8 +447,154 @@ def shortest_path_lengths(g, src):
                 if d[u] + wgt < d[v]:
                     d[v] = d[u] + wgt
                     pq.update(pqlocator[v], d[v], v)
+    if stats is not None:
+        stats.end('search')
+        record_settled(g, cloud, stats)
+    return cloud
+
+def record_settled(g, cloud, stats):
+    """Count the settled vertices of cloud and the edges examined from them
+    Every neighbour of a settled vertex must be settled too"""
+    stats.count('vertices_settled', len(cloud))
+    record_scans(g, sum(g.degree(u) for u in cloud), stats)
+
+def record_scans(g, scans, stats):
+    """Record scans incident-edge scans as edges examined once each"""
+    stats.count('edges_relaxed', scans if g.is_directed() else scans // 2)
+
+def check_integer_weight(wgt):
+    """Raise ValueError unless wgt is a non-negative integer edge weight"""
+    if not isinstance(wgt, int) or wgt < 0:
+        raise ValueError('Edge weights must be non-negative integers')
+
+def radix_shortest_path_lengths(g, src, stats=None):
+    """Compute shortest-path distances from src using a monotone radix heap
+    Edges of g must have non-negative integer weights.
+    Return dictionary mapping each reachable vertex to its distance from src
+    """
+    d = {src: 0}
+    cloud = {}
+    pq = RadixHeap()
+    if stats is not None:
+        pq = stats.queue(pq)
+        stats.begin('search')
+    pq.add(0, src)
+    while not pq.is_empty():
+        key, u = pq.remove_min()
+        if u in cloud:
+            continue
+        cloud[u] = key
+        for e in g.incident_edges(u):
+            v = e.opposite(u)
+            if v not in cloud:
+                wgt = e.element()
+                check_integer_weight(wgt)
+                if v not in d or key + wgt < d[v]:
+                    d[v] = key + wgt
+                    pq.add(d[v], v)
+    if stats is not None:
+        stats.end('search')
+        record_settled(g, cloud, stats)
     return cloud
 
+def array_adjacency(g):
+    """Return (verts, index, offsets, targets, weights) describing graph g
+
+    verts lists the vertices of g and index maps each vertex to its position
+    in verts. The outgoing edges of the i-th vertex are stored in the integer
+    arrays targets and weights between offsets[i] and offsets[i+1].
+    Edges of g must have non-negative integer weights.
+    """
+    verts = list(g.vertices())
+    index = {v: i for i, v in enumerate(verts)}
+    offsets = array('q', [0])
+    targets = array('q')
+    weights = array('q')
+    for u in verts:
+        for e in g.incident_edges(u):
+            wgt = e.element()
+            check_integer_weight(wgt)
+            targets.append(index[e.opposite(u)])
+            weights.append(wgt)
+        offsets.append(len(targets))
+    return verts, index, offsets, targets, weights
+
+def relax_requests(requests, dist, buckets, delta):
+    """Apply a batch of (vertex, distance) relaxations for delta-stepping"""
+    for v, x in requests:
+        old = dist[v]
+        if x < old:
+            if old != float('inf'):
+                bucket = buckets.get(old // delta)
+                if bucket is not None:
+                    bucket.discard(v)
+            dist[v] = x
+            buckets.setdefault(x // delta, set()).add(v)
+
+def delta_stepping_path_lengths(g, src, delta=None, stats=None):
+    """Compute shortest-path distances from src using delta-stepping
+
+    Vertices are kept in buckets of width delta and each bucket is relaxed in
+    batches over an array adjacency of g: light edges (weight <= delta) until
+    the bucket stays empty, then heavy edges once for every settled vertex.
+    If delta is None, the mean edge weight is used.
+    With stats, phases counts the light-edge rounds over all buckets and
+    relax_requests the relaxations issued, which may revisit an edge while
+    its bucket is re-relaxed.
+    Edges of g must have non-negative integer weights.
+    Return dictionary mapping each reachable vertex to its distance from src
+    """
+    if stats is not None:
+        stats.begin('initialize')
+    verts, index, offsets, targets, weights = array_adjacency(g)
+    if delta is None:
+        delta = max(1, sum(weights) // len(weights)) if len(weights) > 0 else 1
+    elif delta < 1:
+        raise ValueError('delta must be positive')
+    dist = [float('inf')] * len(verts)
+    s = index[src]
+    dist[s] = 0
+    buckets = {0: {s}}
+    if stats is not None:
+        stats.end('initialize')
+        stats.begin('search')
+        scans = 0
+    while len(buckets) > 0:
+        i = min(buckets)
+        settled = set()
+        while i in buckets:
+            frontier = buckets.pop(i)
+            settled.update(frontier)
+            if stats is not None:
+                stats.count('phases')
+                stats.peak('frontier_size', len(frontier))
+            requests = []
+            for u in frontier:
+                du = dist[u]
+                for j in range(offsets[u], offsets[u+1]):
+                    if weights[j] <= delta:
+                        requests.append((targets[j], du + weights[j]))
+            relax_requests(requests, dist, buckets, delta)
+            if stats is not None:
+                stats.count('relax_requests', len(requests))
+        requests = []
+        for u in settled:
+            du = dist[u]
+            for j in range(offsets[u], offsets[u+1]):
+                if weights[j] > delta:
+                    requests.append((targets[j], du + weights[j]))
+        relax_requests(requests, dist, buckets, delta)
+        for b in [b for b in buckets if not buckets[b]]:
+            del buckets[b]
+        if stats is not None:
+            stats.count('vertices_settled', len(settled))
+            stats.count('relax_requests', len(requests))
+            scans += sum(offsets[u+1] - offsets[u] for u in settled)
+    if stats is not None:
+        stats.end('search')
+        record_scans(g, scans, stats)
+    return {verts[v]: dist[v] for v in range(len(verts)) if dist[v] != float('inf')}
+
 def shortest_path_tree(g, s, d):
     """Reconstruct shortest-path tree rooted at vertex s, given distance map d
 
@@ -233,22 +603,26 @@ def shortest_path_tree(g, s, d):
     """
     tree = {}
     for v in d:
-        if v is not s:
+        if v != s:
             for e in g.incident_edges(v, False):
                 u = e.opposite(v)
                 wgt = e.element()
-                if d[v] == d[u] + wgt:
+                if u in d and d[v] == d[u] + wgt:
                     tree[v] = e
     return tree
 
-def MST_PrimJarnik(g):
+def MST_PrimJarnik(g, stats=None, queue_factory=AdaptableHeapPriorityQueue):
     """Compute a minimum spanning tree of weighted graph g
     Return a list of edges that comprise the MST
+    queue_factory is called to create the adaptable priority queue
     """
     d = {}
     tree = []
-    pq = AdaptableHeapPriorityQueue()
+    pq = queue_factory()
     pqlocator = {}
+    if stats is not None:
+        pq = stats.queue(pq)
+        stats.begin('initialize')
 
     for v in g.vertices():
         if len(d) == 0:
@@ -256,6 +630,9 @@ def MST_PrimJarnik(g):
         else:
             d[v] = float('inf')
         pqlocator[v] = pq.add(d[v], (v, None))
+    if stats is not None:
+        stats.end('initialize')
+        stats.begin('search')
     while not pq.is_empty():
         key, value = pq.remove_min()
         u, edge = value
@@ -269,8 +646,12 @@ def MST_PrimJarnik(g):
                 if wgt < d[v]:
                     d[v] = wgt
                     pq.update(pqlocator[v], d[v], (v, link))
+    if stats is not None:
+        stats.end('search')
+        record_settled(g, [u for u in d if u not in pqlocator], stats)
+    return tree
 
-def MST_Kruskal(g):
+def MST_Kruskal(g, stats=None):
     """Compute a minimum spanning tree of a graph using Kruskal's algorithm.
 
     Return a list of edges that comprise the MST
@@ -281,12 +662,18 @@ def MST_Kruskal(g):
     pq = HeapPriorityQueue()
     forest = Partition()
     position = {}
+    if stats is not None:
+        pq = stats.queue(pq)
+        stats.begin('initialize')
     for v in g.vertices():
         position[v] = forest.make_group(v)
 
     for e in g.edges():
         pq.add(e.element(), e)
 
+    if stats is not None:
+        stats.end('initialize')
+        stats.begin('search')
     size = g.vertex_count()
     while len(tree) != size - 1 and not pq.is_empty():
         weight, edge = pq.remove_min()
@@ -296,6 +683,9 @@ def MST_Kruskal(g):
         if a != b:
             tree.append(edge)
             forest.union(a, b)
+    if stats is not None:
+        stats.end('search')
+        stats.count('edges_relaxed', g.edge_count() - len(pq))
     return tree
 
 class Partition:
@@ -0,0 +1,176 @@
+import pickle
+from multiprocessing import Pipe, Process
+from zlib import crc32
+
+def partition_of(v, workers):
+    """Return the rank of the worker that owns vertex id v
+
+    Integer ids are partitioned by value; other ids by a CRC of their repr,
+    which unlike hash() is stable across processes.
+    """
+    if isinstance(v, int):
+        return v % workers
+    return crc32(repr(v).encode()) % workers
+
+def send(conn, message):
+    """Pickle message onto conn and return the number of bytes sent"""
+    data = pickle.dumps(message, pickle.HIGHEST_PROTOCOL)
+    conn.send_bytes(data)
+    return len(data)
+
+def bfs_worker(conn, rank, workers, loader):
+    """Serve BFS requests for the partition of vertices owned by rank
+
+    adjacency maps each owned vertex id to the list of its neighbor ids and
+    dist maps each owned vertex reached by the current search to its level.
+    If loader is given, loader(rank, workers) yields the (u, v) edges whose
+    origin u is owned by this worker.
+    """
+    adjacency = {}
+    dist = {}
+    if loader is not None:
+        for u, v in loader(rank, workers):
+            adjacency.setdefault(u, []).append(v)
+    while True:
+        message = pickle.loads(conn.recv_bytes())
+        command = message[0]
+        if command == 'edges':
+            for u, v in message[1]:
+                adjacency.setdefault(u, []).append(v)
+        elif command == 'level':
+            depth, batch = message[1], message[2]
+            outgoing = [set() for _ in range(workers)]
+            settled = 0
+            for u in batch:
+                if u not in dist:
+                    dist[u] = depth
+                    settled += 1
+                    for v in adjacency.get(u, ()):
+                        outgoing[partition_of(v, workers)].add(v)
+            send(conn, ('frontier', settled, [list(part) for part in outgoing]))
+        elif command == 'reset':
+            dist = {}
+        elif command == 'distances':
+            send(conn, dist)
+        elif command == 'sizes':
+            send(conn, (len(adjacency), sum(len(adj) for adj in adjacency.values())))
+        elif command == 'stop':
+            break
+    conn.close()
+
+class PartitionedBFS:
+    """Breadth-first search over a graph hash-partitioned across worker processes
+
+    Each worker process owns the adjacency lists of the vertex ids assigned
+    to it by partition_of. At every level the coordinator sends each worker
+    the frontier batch it owns; the worker settles the unvisited vertices and
+    returns their neighbors grouped by owner, which form the next batches.
+    Vertex ids must be picklable and hashable, such as CompactGraph vertices.
+    """
+
+    def __init__(self, workers=2, directed=False, loader=None):
+        """Start the given number of worker processes
+
+        If loader is given, each worker calls loader(rank, workers) to read
+        its own edges, so the adjacency never passes through this process.
+        """
+        if workers < 1:
+            raise ValueError('workers must be positive')
+        self.workers = workers
+        self.directed = directed
+        self.conns = []
+        self.processes = []
+        self.level_bytes = []
+        for rank in range(workers):
+            parent, child = Pipe()
+            process = Process(target=bfs_worker, args=(child, rank, workers, loader))
+            process.daemon = True
+            process.start()
+            child.close()
+            self.conns.append(parent)
+            self.processes.append(process)
+
+    def add_edges(self, edges, batch_size=10000):
+        """Route (u, v) vertex id pairs to the workers that own them"""
+        batches = [[] for _ in range(self.workers)]
+        for u, v in edges:
+            batches[partition_of(u, self.workers)].append((u, v))
+            if not self.directed:
+                batches[partition_of(v, self.workers)].append((v, u))
+            for rank in range(self.workers):
+                if len(batches[rank]) >= batch_size:
+                    send(self.conns[rank], ('edges', batches[rank]))
+                    batches[rank] = []
+        for rank in range(self.workers):
+            if batches[rank]:
+                send(self.conns[rank], ('edges', batches[rank]))
+
+    def add_graph(self, g, key=None):
+        """Distribute the edges of graph g, identifying vertex v by key(v)
+
+        key defaults to the vertex itself, which suits CompactGraph.
+        """
+        if g.is_directed() != self.directed:
+            raise ValueError('Graph directedness does not match the engine')
+        if key is None:
+            key = lambda v: v
+        self.add_edges((key(e.origin), key(e.destination)) for e in g.edges())
+
+    def bfs(self, source):
+        """Run BFS from source and return a dictionary of vertex id levels
+
+        level_bytes is reset to a list of (depth, bytes sent, bytes received)
+        tuples, one per level of the search.
+        """
+        for conn in self.conns:
+            send(conn, ('reset',))
+        batches = [[] for _ in range(self.workers)]
+        batches[partition_of(source, self.workers)].append(source)
+        self.level_bytes = []
+        depth = 0
+        while any(batches):
+            sent = 0
+            for rank in range(self.workers):
+                sent += send(self.conns[rank], ('level', depth, batches[rank]))
+            received = 0
+            next_batches = [set() for _ in range(self.workers)]
+            for conn in self.conns:
+                data = conn.recv_bytes()
+                received += len(data)
+                for rank, part in enumerate(pickle.loads(data)[2]):
+                    next_batches[rank].update(part)
+            self.level_bytes.append((depth, sent, received))
+            batches = [list(part) for part in next_batches]
+            depth += 1
+        return self.distances()
+
+    def distances(self):
+        """Return the merged level map of the most recent search"""
+        result = {}
+        for conn in self.conns:
+            send(conn, ('distances',))
+        for conn in self.conns:
+            result.update(pickle.loads(conn.recv_bytes()))
+        return result
+
+    def partition_sizes(self):
+        """Return a list of (vertices, adjacency entries) owned by each worker"""
+        for conn in self.conns:
+            send(conn, ('sizes',))
+        return [pickle.loads(conn.recv_bytes()) for conn in self.conns]
+
+    def close(self):
+        """Stop all worker processes"""
+        for conn in self.conns:
+            send(conn, ('stop',))
+            conn.close()
+        for process in self.processes:
+            process.join()
+        self.conns = []
+        self.processes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,4 +1,4 @@
-from _collections import MutableMapping
+from collections.abc import MutableMapping
 from random import randrange
 
 class MapBase(MutableMapping):
@@ -213,10 +213,10 @@ class SortedTableMap(MapBase):
 
     def __delitem__(self, k):
         """Remove item associated with k"""
-        j = self.find_index((k, 0, len(self.table)-1))
+        j = self.find_index(k, 0, len(self.table)-1)
         if j == len(self.table) or self.table[j].key != k:
             raise KeyError('Key Error: '+repr(k))
-        self.table.pop()
+        self.table.pop(j)
 
     def __iter__(self):
         """Generate keys of the map ordered from minimum to maximum"""
@@ -224,6 +224,13 @@ class SortedTableMap(MapBase):
             yield item.key
 
     def find_min(self):
+        """Return (key, value) pair with minimum key (or None if empty)"""
+        if len(self.table) > 0:
+            return (self.table[0].key, self.table[0].value)
+        else:
+            return None
+
+    def find_max(self):
         """Return (key, value) pair with maximum key (or None if empty)"""
         if len(self.table) > 0:
             return (self.table[-1].key, self.table[-1].value)
@@ -238,6 +245,16 @@ class SortedTableMap(MapBase):
         else:
             return None
 
+    def find_le(self, k):
+        """Return (key, value) pair with greatest key less than or equal to k"""
+        j = self.find_index(k, 0, len(self.table)-1)
+        if j < len(self.table) and self.table[j].key == k:
+            return (self.table[j].key, self.table[j].value)
+        elif j > 0:
+            return (self.table[j-1].key, self.table[j-1].value)
+        else:
+            return None
+
     def find_lt(self, k):
         """Return (key, value) pair with greatest key strictly less than k"""
         j = self.find_index(k, 0, len(self.table)-1)
@@ -0,0 +1,158 @@
+import asyncio
+import threading
+from itertools import count
+from time import monotonic
+from priorityQueues.priorityQueue import HeapPriorityQueue
+
+class Empty(Exception):
+    """Raised when no item became available in time"""
+    pass
+
+class Full(Exception):
+    """Raised when no free space became available in time"""
+    pass
+
+class BlockingPriorityQueue:
+    """A thread-safe min-oriented priority queue for producer/consumer use
+
+    Entries with equal keys are removed in the order they were added.
+    If maxsize is positive, put blocks while the queue holds maxsize entries.
+    """
+
+    def __init__(self, maxsize=0):
+        """Create a new empty Priority Queue"""
+        self.maxsize = maxsize
+        self.data = HeapPriorityQueue()
+        self.counter = count()
+        self.mutex = threading.Lock()
+        self.not_empty = threading.Condition(self.mutex)
+        self.not_full = threading.Condition(self.mutex)
+
+    def __len__(self):
+        """Return the number of items in the priority queue"""
+        with self.mutex:
+            return len(self.data)
+
+    def is_empty(self):
+        """Return True if the priority queue is empty"""
+        return len(self) == 0
+
+    def wait_for(self, condition, ready, block, timeout, error):
+        """Wait on condition until ready() holds; the mutex must be held"""
+        if not block:
+            if not ready():
+                raise error
+        elif timeout is None:
+            while not ready():
+                condition.wait()
+        else:
+            end = monotonic() + timeout
+            while not ready():
+                remaining = end - monotonic()
+                if remaining <= 0:
+                    raise error
+                condition.wait(remaining)
+
+    def put(self, key, value, block=True, timeout=None):
+        """Add a key-value pair, waiting for free space if the queue is full
+        Raise Full if no space became available"""
+        with self.not_full:
+            if self.maxsize > 0:
+                self.wait_for(self.not_full, lambda: len(self.data) < self.maxsize,
+                              block, timeout, Full('Priority queue is full'))
+            self.data.add((key, next(self.counter)), value)
+            self.not_empty.notify()
+
+    def get(self, block=True, timeout=None):
+        """Remove and return (k,v) tuple with minimum key, waiting for an item
+        Raise Empty if no item became available"""
+        with self.not_empty:
+            self.wait_for(self.not_empty, lambda: len(self.data) > 0,
+                          block, timeout, Empty('Priority queue is empty'))
+            key, value = self.data.remove_min()
+            self.not_full.notify()
+            return (key[0], value)
+
+    def get_batch(self, max_items, timeout=None):
+        """Remove and return a list of up to max_items (k,v) tuples in key order
+
+        Waits until at least one item is available; returns an empty list if
+        timeout seconds pass first.
+        """
+        with self.not_empty:
+            try:
+                self.wait_for(self.not_empty, lambda: len(self.data) > 0,
+                              True, timeout, Empty())
+            except Empty:
+                return []
+            batch = self.data.pop_many(max_items)
+            self.not_full.notify(len(batch))
+            return [(key[0], value) for key, value in batch]
+
+class AsyncPriorityQueue:
+    """A min-oriented priority queue for coroutines of one asyncio event loop
+
+    Entries with equal keys are removed in the order they were added.
+    If maxsize is positive, put waits while the queue holds maxsize entries.
+    """
+
+    def __init__(self, maxsize=0):
+        """Create a new empty Priority Queue"""
+        self.maxsize = maxsize
+        self.data = HeapPriorityQueue()
+        self.counter = count()
+        self.not_empty = None
+        self.not_full = None
+
+    def conditions(self):
+        """Create the conditions on first use, inside the running event loop"""
+        if self.not_empty is None:
+            lock = asyncio.Lock()
+            self.not_empty = asyncio.Condition(lock)
+            self.not_full = asyncio.Condition(lock)
+
+    def __len__(self):
+        """Return the number of items in the priority queue"""
+        return len(self.data)
+
+    def is_empty(self):
+        """Return True if the priority queue is empty"""
+        return len(self.data) == 0
+
+    def full(self):
+        """Return True if the priority queue holds maxsize entries"""
+        return 0 < self.maxsize <= len(self.data)
+
+    async def put(self, key, value):
+        """Add a key-value pair, waiting for free space if the queue is full"""
+        self.conditions()
+        async with self.not_full:
+            await self.not_full.wait_for(lambda: not self.full())
+            self.data.add((key, next(self.counter)), value)
+            self.not_empty.notify()
+
+    async def get(self):
+        """Remove and return (k,v) tuple with minimum key, waiting for an item"""
+        self.conditions()
+        async with self.not_empty:
+            await self.not_empty.wait_for(lambda: len(self.data) > 0)
+            key, value = self.data.remove_min()
+            self.not_full.notify()
+            return (key[0], value)
+
+    async def get_batch(self, max_items, timeout=None):
+        """Remove and return a list of up to max_items (k,v) tuples in key order
+
+        Waits until at least one item is available; returns an empty list if
+        timeout seconds pass first.
+        """
+        self.conditions()
+        async with self.not_empty:
+            if len(self.data) == 0:
+                try:
+                    await asyncio.wait_for(self.not_empty.wait_for(lambda: len(self.data) > 0), timeout)
+                except asyncio.TimeoutError:
+                    return []
+            batch = self.data.pop_many(max_items)
+            self.not_full.notify(len(batch))
+            return [(key[0], value) for key, value in batch]
@@ -0,0 +1,184 @@
+import pickle
+import tempfile
+from priorityQueues.priorityQueue import PriorityQueueBase, HeapPriorityQueue, AdaptableHeapPriorityQueue
+
+class SortedRun:
+    """Sorted (k,v) pairs spilled to a temporary file and read back in blocks"""
+
+    def __init__(self, pairs, block_size, directory=None):
+        """Write the sorted iterable pairs to a new temporary file"""
+        self.file = tempfile.TemporaryFile(dir=directory)
+        block = []
+        for pair in pairs:
+            block.append(pair)
+            if len(block) == block_size:
+                pickle.dump(block, self.file, pickle.HIGHEST_PROTOCOL)
+                block = []
+        if block:
+            pickle.dump(block, self.file, pickle.HIGHEST_PROTOCOL)
+        self.file.seek(0)
+        self.block = []
+        self.pos = 0
+        self.load()
+
+    def load(self):
+        """Read the next block, closing the file once it is exhausted"""
+        self.pos = 0
+        try:
+            self.block = pickle.load(self.file)
+        except EOFError:
+            self.block = []
+            self.file.close()
+
+    def head(self):
+        """Return the smallest unread (k,v) pair, or None if the run is exhausted"""
+        return self.block[self.pos] if self.pos < len(self.block) else None
+
+    def advance(self):
+        """Move past the current head"""
+        self.pos += 1
+        if self.pos == len(self.block):
+            self.load()
+
+    def close(self):
+        self.block = []
+        self.file.close()
+
+class ExternalPriorityQueue(PriorityQueueBase):
+    """A min-oriented priority queue that spills to disk past a memory budget
+
+    Up to memory_limit items are kept in an in-memory heap. When it
+    overflows, the larger half is sorted and written to a temporary file as a
+    run. remove_min compares the in-memory minimum with the heads of the
+    runs, reading each run block_size items at a time.
+
+    Runs are merged in tiers: a new run joins tier 0, and once a tier holds
+    max_runs runs they are merged into one run of the next tier. Each item is
+    therefore rewritten once per tier, O(log n / log max_runs) times, and at
+    most max_runs - 1 runs per tier are open at once.
+    """
+
+    def __init__(self, memory_limit=100000, block_size=1000, max_runs=16, directory=None):
+        """Create a new empty Priority Queue
+        Runs are written to temporary files in directory (default: system tmp)"""
+        if memory_limit < 2 or block_size < 1 or max_runs < 2:
+            raise ValueError('memory_limit, block_size and max_runs are too small')
+        self.memory_limit = memory_limit
+        self.block_size = block_size
+        self.max_runs = max_runs
+        self.directory = directory
+        self.hot = HeapPriorityQueue()
+        self.runs = AdaptableHeapPriorityQueue()
+        self.tiers = []
+        self.size = 0
+
+    def __len__(self):
+        """Return the number of items in the priority queue"""
+        return self.size
+
+    def run_count(self):
+        """Return the number of runs currently on disk"""
+        return sum(len(tier) for tier in self.tiers)
+
+    def add(self, key, value):
+        """Add a key-value pair to the priority queue"""
+        self.hot.add(key, value)
+        self.size += 1
+        if len(self.hot) > self.memory_limit:
+            self.spill()
+
+    def spill(self):
+        """Write the larger half of the in-memory heap to a new sorted run"""
+        pairs = sorted(((item.key, item.value) for item in self.hot.data), key=lambda pair: pair[0])
+        half = len(pairs) // 2
+        self.hot = HeapPriorityQueue.from_items(pairs[:half])
+        self.add_run(SortedRun(pairs[half:], self.block_size, self.directory), 0)
+        tier = 0
+        while tier < len(self.tiers) and len(self.tiers[tier]) >= self.max_runs:
+            self.merge_tier(tier)
+            tier += 1
+
+    def add_run(self, run, tier):
+        """Record run as a member of the given tier"""
+        while len(self.tiers) <= tier:
+            self.tiers.append([])
+        run.tier = tier
+        self.tiers[tier].append(run)
+        self.schedule(run)
+
+    def schedule(self, run):
+        """Enter run in the heap of run heads, or drop it once exhausted"""
+        head = run.head()
+        if head is not None:
+            run.locator = self.runs.add(head[0], run)
+        else:
+            self.tiers[run.tier].remove(run)
+
+    def merged_runs(self, runs):
+        """Generate the (k,v) pairs of the given runs in key order, consuming them"""
+        heads = HeapPriorityQueue()
+        for run in runs:
+            head = run.head()
+            if head is not None:
+                heads.add(head[0], run)
+        while not heads.is_empty():
+            key, run = heads.remove_min()
+            yield run.head()
+            run.advance()
+            head = run.head()
+            if head is not None:
+                heads.add(head[0], run)
+
+    def merge_runs(self, runs, tier):
+        """Replace the given runs by a single merged run in the given tier"""
+        for run in runs:
+            self.tiers[run.tier].remove(run)
+            self.runs.remove(run.locator)
+        self.add_run(SortedRun(self.merged_runs(runs), self.block_size, self.directory), tier)
+
+    def merge_tier(self, tier):
+        """Merge all runs of a tier into one run of the next tier"""
+        self.merge_runs(list(self.tiers[tier]), tier + 1)
+
+    def compact(self):
+        """Merge all runs into a single run"""
+        runs = [run for tier in self.tiers for run in tier]
+        if len(runs) > 1:
+            self.merge_runs(runs, len(self.tiers) - 1)
+
+    def min(self):
+        """Return but do not remove (k,v) tuple with minimum key"""
+        if self.is_empty():
+            raise Exception('Priority queue is empty')
+        if self.runs.is_empty() or (not self.hot.is_empty() and not self.runs.min()[0] < self.hot.min()[0]):
+            return self.hot.min()
+        return self.runs.min()[1].head()
+
+    def remove_min(self):
+        """Remove and return (k,v) tuple with minimum key"""
+        if self.is_empty():
+            raise Exception('Priority queue is empty')
+        self.size -= 1
+        if self.runs.is_empty() or (not self.hot.is_empty() and not self.runs.min()[0] < self.hot.min()[0]):
+            return self.hot.remove_min()
+        key, run = self.runs.remove_min()
+        pair = run.head()
+        run.advance()
+        self.schedule(run)
+        return pair
+
+    def close(self):
+        """Discard all entries and delete the run files"""
+        for tier in self.tiers:
+            for run in tier:
+                run.close()
+        self.tiers = []
+        self.runs = AdaptableHeapPriorityQueue()
+        self.hot = HeapPriorityQueue()
+        self.size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,3 +1,4 @@
+from array import array
 from linkedlists.positionallist import PositionalList
 class PriorityQueueBase:
     """Abstract base class for a priority queue"""
@@ -132,10 +133,53 @@ class HeapPriorityQueue(PriorityQueueBase):
                 self.swap(j, small_child)
                 self.downheap(small_child)
 
+    def sift_up(self, j):
+        """Move the item at index j up to its place, iteratively"""
+        data = self.data
+        item = data[j]
+        while j > 0:
+            parent = (j-1) // 2
+            if not item < data[parent]:
+                break
+            data[j] = data[parent]
+            j = parent
+        data[j] = item
+
+    def sift_down(self, j):
+        """Move the item at index j down to its place, iteratively"""
+        data = self.data
+        n = len(data)
+        if j >= n:
+            return
+        item = data[j]
+        child = 2*j + 1
+        while child < n:
+            if child + 1 < n and data[child+1] < data[child]:
+                child += 1
+            if not data[child] < item:
+                break
+            data[j] = data[child]
+            j = child
+            child = 2*j + 1
+        data[j] = item
+
+    def heapify(self):
+        """Restore the heap-order property of the whole array in O(n) time"""
+        for j in range(len(self.data) // 2 - 1, -1, -1):
+            self.sift_down(j)
+
     def __init__(self):
         """Create a new empty Priority Queue"""
         self.data = []
 
+    @classmethod
+    def from_items(cls, pairs):
+        """Create a Priority Queue from (k,v) pairs by bottom-up construction"""
+        pq = cls()
+        pq.data = [pq.Item(k, v) for k, v in pairs]
+        pq.heapify()
+        return pq
+
     def __len__(self):
         """Return the number of items in the priority queue"""
         return len(self.data)
@@ -143,7 +187,25 @@ class HeapPriorityQueue(PriorityQueueBase):
     def add(self, key, value):
         """Add a key-value pair to the priority queue"""
         self.data.append(self.Item(key, value))
-        self.upheap(len(self.data)-1)
+        self.sift_up(len(self.data)-1)
+
+    def add_many(self, pairs):
+        """Add all (k,v) pairs to the priority queue
+
+        Small batches are sifted up one at a time; batches that are large
+        relative to the queue are appended and the whole array is heapified.
+        """
+        self.insert_items([self.Item(k, v) for k, v in pairs])
+
+    def insert_items(self, items):
+        """Append items to the array and restore the heap-order property"""
+        old = len(self.data)
+        self.data.extend(items)
+        if len(items) * len(self.data).bit_length() > len(self.data):
+            self.heapify()
+        else:
+            for j in range(old, len(self.data)):
+                self.sift_up(j)
 
     def min(self):
         """Return but do not remove (k,v) tuple with minimum key"""
@@ -158,7 +220,40 @@ class HeapPriorityQueue(PriorityQueueBase):
             raise Exception('Priority queue is empty')
         self.swap(0, len(self.data)-1)
         item = self.data.pop()
-        self.downheap(0)
+        self.sift_down(0)
+        return (item.key, item.value)
+
+    def pop_many(self, k):
+        """Remove and return a list of up to k (k,v) tuples in key order"""
+        data = self.data
+        result = []
+        while data and len(result) < k:
+            item = data[0]
+            last = data.pop()
+            if data:
+                data[0] = last
+                self.sift_down(0)
+            result.append((item.key, item.value))
+        return result
+
+    def pushpop(self, key, value):
+        """Add a key-value pair, then remove and return (k,v) tuple with minimum key
+        Faster than calling add followed by remove_min."""
+        if not self.data or not self.data[0].key < key:
+            return (key, value)
+        item = self.data[0]
+        self.data[0] = self.Item(key, value)
+        self.sift_down(0)
+        return (item.key, item.value)
+
+    def replace(self, key, value):
+        """Remove and return (k,v) tuple with minimum key, then add a key-value pair
+        Faster than calling remove_min followed by add."""
+        if self.is_empty():
+            raise Exception('Priority queue is empty')
+        item = self.data[0]
+        self.data[0] = self.Item(key, value)
+        self.sift_down(0)
         return (item.key, item.value)
 
 class AdaptableHeapPriorityQueue(HeapPriorityQueue):
@@ -170,42 +265,714 @@ class AdaptableHeapPriorityQueue(HeapPriorityQueue):
             super().__init__(k, v)
             self.index = j
 
-        def swap(self, i, j):
-            super().swap(i, j)
-            self.data[i].index = i
-            self.data[j].index = j
+    def swap(self, i, j):
+        super().swap(i, j)
+        self.data[i].index = i
+        self.data[j].index = j
+
+    def sift_up(self, j):
+        self.upheap(j)
+
+    def sift_down(self, j):
+        if j < len(self.data):
+            self.downheap(j)
+
+    @classmethod
+    def from_items(cls, pairs):
+        """Create a Priority Queue from (k,v) pairs by bottom-up construction
+        Use add_many on an empty queue to also obtain the Locators"""
+        pq = cls()
+        pq.add_many(pairs)
+        return pq
+
+    def add_many(self, pairs):
+        """Add all (k,v) pairs and return the list of their Locators in order"""
+        old = len(self.data)
+        tokens = [self.Locator(k, v, old + j) for j, (k, v) in enumerate(pairs)]
+        self.insert_items(tokens)
+        return tokens
+
+    def pop_many(self, k):
+        """Remove and return a list of up to k (k,v) tuples in key order"""
+        result = []
+        while self.data and len(result) < k:
+            result.append(self.remove_min())
+        return result
+
+    def pushpop(self, key, value):
+        """Add a key-value pair, then remove and return the entry with minimum key
+        Return ((k,v) tuple removed, Locator of the added pair); the Locator is
+        None if the added pair itself was the minimum."""
+        if not self.data or not self.data[0].key < key:
+            return (key, value), None
+        return self.replace(key, value)
+
+    def replace(self, key, value):
+        """Remove the entry with minimum key, then add a key-value pair
+        Return ((k,v) tuple removed, Locator of the added pair)"""
+        if self.is_empty():
+            raise Exception('Priority queue is empty')
+        item = self.data[0]
+        token = self.Locator(key, value, 0)
+        self.data[0] = token
+        self.sift_down(0)
+        return (item.key, item.value), token
+
+    def bubble(self, j):
+        if j>0 and self.data[j] < self.data[self.parent(j)]:
+            self.upheap(j)
+        else:
+            self.downheap(j)
+
+    def add(self, key, value):
+        """Add a key-value pair"""
+        token = self.Locator(key, value, len(self.data))
+        self.data.append(token)
+        self.upheap(len(self.data)-1)
+        return token
+
+    def update(self, loc, newkey, newval):
+        """Update the key and value for the entry identified by Locator loc"""
+        j = loc.index
+        if not (0 <= j < len(self) and self.data[j] is loc):
+            raise ValueError('Invalid Locator')
+        loc.key = newkey
+        loc.value = newval
+        self.bubble(j)
+
+    def remove(self, loc):
+        """Remove and return the (k,v) pair identified by Locator loc"""
+        j = loc.index
+        if not (0 <= j < len(self) and self.data[j] is loc):
+            raise ValueError('Invalid locator')
+        if j == len(self) - 1:
+            self.data.pop()
+        else:
+            self.swap(j, len(self)-1)
+            self.data.pop()
+            self.bubble(j)
+        return (loc.key, loc.value)
+
+class RadixHeap(PriorityQueueBase):
+    """A monotone min-oriented priority queue for non-negative integer keys
+
+    Keys must never be smaller than the most recently removed minimum.
+    Entries are kept in buckets by the highest bit in which they differ from
+    that minimum, so each entry is moved at most once per bit of its key.
+    """
+
+    def __init__(self):
+        """Create a new empty Priority Queue"""
+        self.buckets = [[]]
+        self.last = 0
+        self.size = 0
+
+    def __len__(self):
+        """Return the number of items in the priority queue"""
+        return self.size
+
+    def add(self, key, value):
+        """Add a key-value pair to the priority queue"""
+        if key < self.last:
+            raise ValueError('Key is smaller than the last removed minimum')
+        j = (key ^ self.last).bit_length()
+        while len(self.buckets) <= j:
+            self.buckets.append([])
+        self.buckets[j].append((key, value))
+        self.size += 1
+
+    def redistribute(self):
+        """Refill bucket 0 from the first non-empty bucket"""
+        buckets = self.buckets
+        j = 1
+        while not buckets[j]:
+            j += 1
+        moved = buckets[j]
+        buckets[j] = []
+        last = min(entry[0] for entry in moved)
+        self.last = last
+        for entry in moved:
+            buckets[(entry[0] ^ last).bit_length()].append(entry)
+
+    def min(self):
+        """Return but do not remove (k,v) tuple with minimum key"""
+        if self.is_empty():
+            raise Exception('Priority queue is empty')
+        if not self.buckets[0]:
+            self.redistribute()
+        return self.buckets[0][-1]
+
+    def remove_min(self):
+        """Remove and return (k,v) tuple with minimum key"""
+        if self.is_empty():
+            raise Exception('Priority queue is empty')
+        if not self.buckets[0]:
+            self.redistribute()
+        self.size -= 1
+        return self.buckets[0].pop()
+
+class DaryHeapPriorityQueue(AdaptableHeapPriorityQueue):
+    """A locator based priority queue implemented with a d-ary heap
+
+    A larger d makes the heap shallower, so update with a smaller key and add
+    touch fewer levels, at the cost of comparing d children in downheap.
+    """
+
+    def __init__(self, d=4):
+        """Create a new empty Priority Queue where each node has d children"""
+        if d < 2:
+            raise ValueError('d must be at least 2')
+        super().__init__()
+        self.d = d
+
+    def parent(self, j):
+        return (j-1) // self.d
+
+    def upheap(self, j):
+        data = self.data
+        item = data[j]
+        while j > 0:
+            parent = (j-1) // self.d
+            if not item < data[parent]:
+                break
+            data[j] = data[parent]
+            data[j].index = j
+            j = parent
+        data[j] = item
+        item.index = j
+
+    def downheap(self, j):
+        data = self.data
+        n = len(data)
+        if j >= n:
+            return
+        item = data[j]
+        while True:
+            first = self.d*j + 1
+            if first >= n:
+                break
+            small_child = first
+            for c in range(first+1, min(first+self.d, n)):
+                if data[c] < data[small_child]:
+                    small_child = c
+            if not data[small_child] < item:
+                break
+            data[j] = data[small_child]
+            data[j].index = j
+            j = small_child
+        data[j] = item
+        item.index = j
+
+class PairingHeapPriorityQueue(PriorityQueueBase):
+    """A locator based priority queue implemented with a pairing heap
+
+    add, meld and update with a smaller key take O(1) time; remove_min
+    takes O(log n) amortized time.
+    """
+
+    class Owner:
+        """Record of the heap that a group of locators belongs to
+        Melding forwards the absorbed heap's owner to the surviving one"""
+
+        def __init__(self, heap):
+            self.heap = heap
+            self.forward = None
+
+    class Locator(PriorityQueueBase.Item):
+        """Pairing heap node that doubles as the locator of its entry
+
+        prev refers to the parent for a leftmost child and to the left
+        sibling otherwise.
+        """
+
+        def __init__(self, k, v):
+            super().__init__(k, v)
+            self.child = None
+            self.sibling = None
+            self.prev = None
+            self.container = None
+
+    def __init__(self):
+        """Create a new empty Priority Queue"""
+        self.root = None
+        self.size = 0
+        self.owner = self.Owner(self)
+
+    def __len__(self):
+        """Return the number of items in the priority queue"""
+        return self.size
+
+    def link(self, a, b):
+        """Make the root with the larger key the leftmost child of the other"""
+        if b is None:
+            return a
+        if a is None:
+            return b
+        if b < a:
+            a, b = b, a
+        b.prev = a
+        b.sibling = a.child
+        if a.child is not None:
+            a.child.prev = b
+        a.child = b
+        return a
+
+    def cut(self, node):
+        """Detach the subtree rooted at node from its parent"""
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = node.prev
+        node.prev = None
+        node.sibling = None
+
+    def merge_pairs(self, first):
+        """Combine a list of sibling subtrees into one tree and return its root"""
+        pairs = []
+        while first is not None:
+            a = first
+            b = a.sibling
+            first = b.sibling if b is not None else None
+            a.prev = a.sibling = None
+            if b is not None:
+                b.prev = b.sibling = None
+            pairs.append(self.link(a, b))
+        root = None
+        while pairs:
+            root = self.link(pairs.pop(), root)
+        return root
+
+    def validate(self, loc):
+        if not isinstance(loc, self.Locator) or loc.container is None:
+            raise ValueError('Invalid locator')
+        owner = loc.container
+        while owner.forward is not None:
+            owner = owner.forward
+        loc.container = owner
+        if owner.heap is not self:
+            raise ValueError('Invalid locator')
+
+    def add(self, key, value):
+        """Add a key-value pair and return its Locator"""
+        token = self.Locator(key, value)
+        token.container = self.owner
+        self.root = self.link(self.root, token)
+        self.size += 1
+        return token
+
+    def min(self):
+        """Return but do not remove (k,v) tuple with minimum key"""
+        if self.is_empty():
+            raise Exception('Priority queue is empty')
+        return (self.root.key, self.root.value)
+
+    def remove_min(self):
+        """Remove and return (k,v) tuple with minimum key"""
+        if self.is_empty():
+            raise Exception('Priority queue is empty')
+        item = self.root
+        self.root = self.merge_pairs(item.child)
+        item.child = None
+        item.container = None
+        self.size -= 1
+        return (item.key, item.value)
 
-        def bubble(self, j):
-            if j>0 and self.data[j] < self.data[self.parent(j)]:
-                self.upheap(j)
+    def detach(self, loc):
+        """Remove loc from the heap, leaving it as a single-node tree"""
+        if loc is self.root:
+            self.root = self.merge_pairs(loc.child)
+        else:
+            self.cut(loc)
+            self.root = self.link(self.root, self.merge_pairs(loc.child))
+        loc.child = None
+
+    def update(self, loc, newkey, newval):
+        """Update the key and value for the entry identified by Locator loc"""
+        self.validate(loc)
+        if newkey < loc.key:
+            if loc is not self.root:
+                self.cut(loc)
+                loc.key = newkey
+                self.root = self.link(self.root, loc)
             else:
-                self.downheap(j)
-
-        def add(self, key, value):
-            """Add a key-value pair"""
-            token = self.Locator(key, value, len(self.data))
-            self.data.append(token)
-            self.upheap(len(self.data)-1)
-            return token
-
-        def update(self, loc, newkey, newval):
-            """Update the key and value for the entry identified by Locator loc"""
-            j = loc.index
-            if not (0 <= j < len(self) and self.data[j] is loc):
-                raise ValueError('Invalid Locator')
+                loc.key = newkey
+        else:
+            self.detach(loc)
             loc.key = newkey
-            loc.value = newval
-            self.bubble(j)
+            self.root = self.link(self.root, loc)
+        loc.value = newval
+
+    def remove(self, loc):
+        """Remove and return the (k,v) pair identified by Locator loc"""
+        self.validate(loc)
+        self.detach(loc)
+        loc.container = None
+        self.size -= 1
+        return (loc.key, loc.value)
+
+    def meld(self, other):
+        """Move all entries of other into this priority queue, leaving other empty
+        Locators issued by other remain valid for this priority queue"""
+        if type(other) is not type(self):
+            raise TypeError('Priority queue types must match')
+        if other is self:
+            return
+        self.root = self.link(self.root, other.root)
+        self.size += other.size
+        other.owner.heap = None
+        other.owner.forward = self.owner
+        other.owner = self.Owner(other)
+        other.root = None
+        other.size = 0
+
+class IndexedHeapPriorityQueue(PriorityQueueBase):
+    """A min-oriented priority queue over dense integer ids 0..capacity-1
+
+    Keys, the binary heap of ids and the position of each id in the heap
+    are flat arrays indexed by id, so no per-entry objects are allocated.
+    Entries are (key, id) pairs; each id is present at most once.
+    """
+
+    def __init__(self, capacity, typecode='d'):
+        """Create a new empty Priority Queue for ids below capacity
+        Keys are stored in an array of the given typecode"""
+        self.keys = array(typecode, bytes(array(typecode).itemsize * capacity))
+        self.heap = array('q')
+        self.position = array('q', [-1]) * capacity
+
+    @classmethod
+    def from_keys(cls, keys, typecode='d'):
+        """Create a Priority Queue holding id j with key keys[j] for every j
+        Construction is bottom-up in O(n) time"""
+        pq = cls(0, typecode)
+        pq.keys = array(typecode, keys)
+        n = len(pq.keys)
+        pq.heap = array('q', range(n))
+        pq.position = array('q', range(n))
+        for j in range(n // 2 - 1, -1, -1):
+            pq.sift_down(j)
+        return pq
+
+    def __len__(self):
+        """Return the number of items in the priority queue"""
+        return len(self.heap)
+
+    def capacity(self):
+        """Return the number of ids this priority queue can hold"""
+        return len(self.position)
+
+    def validate(self, i):
+        if not 0 <= i < len(self.position):
+            raise IndexError('id out of range: ' + repr(i))
+
+    def contains(self, i):
+        """Return True if id i is in the priority queue"""
+        return 0 <= i < len(self.position) and self.position[i] >= 0
+
+    def key(self, i):
+        """Return the key of id i"""
+        if not self.contains(i):
+            raise KeyError('Key Error: ' + repr(i))
+        return self.keys[i]
+
+    def sift_up(self, j):
+        heap, keys, position = self.heap, self.keys, self.position
+        i = heap[j]
+        key = keys[i]
+        while j > 0:
+            parent = (j-1) // 2
+            p = heap[parent]
+            if not key < keys[p]:
+                break
+            heap[j] = p
+            position[p] = j
+            j = parent
+        heap[j] = i
+        position[i] = j
+
+    def sift_down(self, j):
+        heap, keys, position = self.heap, self.keys, self.position
+        n = len(heap)
+        if j >= n:
+            return
+        i = heap[j]
+        key = keys[i]
+        child = 2*j + 1
+        while child < n:
+            if child + 1 < n and keys[heap[child+1]] < keys[heap[child]]:
+                child += 1
+            c = heap[child]
+            if not keys[c] < key:
+                break
+            heap[j] = c
+            position[c] = j
+            j = child
+            child = 2*j + 1
+        heap[j] = i
+        position[i] = j
+
+    def add(self, key, i):
+        """Add id i with the given key"""
+        self.validate(i)
+        if self.position[i] >= 0:
+            raise ValueError('id already present: ' + repr(i))
+        self.keys[i] = key
+        self.position[i] = len(self.heap)
+        self.heap.append(i)
+        self.sift_up(len(self.heap)-1)
+
+    def min(self):
+        """Return but do not remove (k,id) tuple with minimum key"""
+        if self.is_empty():
+            raise Exception('Priority queue is empty')
+        i = self.heap[0]
+        return (self.keys[i], i)
+
+    def remove_min(self):
+        """Remove and return (k,id) tuple with minimum key"""
+        if self.is_empty():
+            raise Exception('Priority queue is empty')
+        i = self.heap[0]
+        return self.remove(i)
+
+    def decrease_key(self, i, key):
+        """Lower the key of id i to key"""
+        if not self.contains(i):
+            raise KeyError('Key Error: ' + repr(i))
+        if self.keys[i] < key:
+            raise ValueError('New key is larger than the current key')
+        self.keys[i] = key
+        self.sift_up(self.position[i])
+
+    def change_key(self, i, key):
+        """Set the key of id i to key, moving it up or down as needed"""
+        if not self.contains(i):
+            raise KeyError('Key Error: ' + repr(i))
+        old = self.keys[i]
+        self.keys[i] = key
+        if key < old:
+            self.sift_up(self.position[i])
+        else:
+            self.sift_down(self.position[i])
+
+    def remove(self, i):
+        """Remove id i and return its (k,id) tuple"""
+        if not self.contains(i):
+            raise KeyError('Key Error: ' + repr(i))
+        j = self.position[i]
+        last = self.heap.pop()
+        self.position[i] = -1
+        if last != i:
+            self.heap[j] = last
+            self.position[last] = j
+            self.sift_up(j)
+            self.sift_down(self.position[last])
+        return (self.keys[i], i)
+
+class MeldableHeapBase(PriorityQueueBase):
+    """Abstract base class for heap-ordered binary trees supporting meld
+
+    Subclasses define merge(a, b), which combines two trees and returns the
+    new root; add and remove_min are both expressed as merges.
+    """
+
+    class Node(PriorityQueueBase.Item):
+        """Tree node storing a key-value pair"""
+
+        def __init__(self, k, v):
+            super().__init__(k, v)
+            self.left = None
+            self.right = None
+            self.rank = 1
+
+    def __init__(self):
+        """Create a new empty Priority Queue"""
+        self.root = None
+        self.size = 0
+
+    def __len__(self):
+        """Return the number of items in the priority queue"""
+        return self.size
+
+    def add(self, key, value):
+        """Add a key-value pair to the priority queue"""
+        self.root = self.merge(self.root, self.Node(key, value))
+        self.size += 1
+
+    def min(self):
+        """Return but do not remove (k,v) tuple with minimum key"""
+        if self.is_empty():
+            raise Exception('Priority queue is empty')
+        return (self.root.key, self.root.value)
 
-        def remove(self, loc):
-            """Remove and return the (k,v) pair identified by Locator loc"""
-            j = loc.index
-            if not (0 <= j < len(self) and self.data[j] is loc):
-                raise ValueError('Invalid locator')
-            if j == len(self) - 1:
-                self.data.pop()
+    def remove_min(self):
+        """Remove and return (k,v) tuple with minimum key"""
+        if self.is_empty():
+            raise Exception('Priority queue is empty')
+        item = self.root
+        self.root = self.merge(item.left, item.right)
+        self.size -= 1
+        return (item.key, item.value)
+
+    def meld(self, other):
+        """Move all entries of other into this priority queue, leaving other empty"""
+        if type(other) is not type(self):
+            raise TypeError('Priority queue types must match')
+        if other is self:
+            return
+        self.root = self.merge(self.root, other.root)
+        self.size += other.size
+        other.root = None
+        other.size = 0
+
+class LeftistHeapPriorityQueue(MeldableHeapBase):
+    """A min-oriented priority queue implemented with a leftist heap
+
+    The rank of a node is the length of its right spine, and every left
+    child has rank at least that of its sibling, so merge, add, meld and
+    remove_min take O(log n) time.
+    """
+
+    def merge(self, a, b):
+        """Merge the right spines of trees a and b and return the new root"""
+        if a is None:
+            return b
+        if b is None:
+            return a
+        if b < a:
+            a, b = b, a
+        root = a
+        path = []
+        while True:
+            path.append(a)
+            if a.right is None:
+                a.right = b
+                break
+            if b < a.right:
+                a.right, b = b, a.right
+            a = a.right
+        for node in reversed(path):
+            left_rank = node.left.rank if node.left is not None else 0
+            right_rank = node.right.rank if node.right is not None else 0
+            if left_rank < right_rank:
+                node.left, node.right = node.right, node.left
+                right_rank = left_rank
+            node.rank = right_rank + 1
+        return root
+
+class SkewHeapPriorityQueue(MeldableHeapBase):
+    """A min-oriented priority queue implemented with a skew heap
+
+    Like a leftist heap without ranks: every node on the merge path swaps
+    its children, giving O(log n) amortized merge, add, meld and remove_min.
+    """
+
+    def merge(self, a, b):
+        """Merge trees a and b top-down and return the new root"""
+        if a is None:
+            return b
+        if b is None:
+            return a
+        if b < a:
+            a, b = b, a
+        root = a
+        while True:
+            right = a.right
+            a.right = a.left
+            if right is None:
+                a.left = b
+                break
+            if b < right:
+                right, b = b, right
+            a.left = right
+            a = right
+        return root
+
+class MinMaxHeapPriorityQueue(HeapPriorityQueue):
+    """A double-ended priority queue implemented with a min-max heap
+
+    The array layout is that of HeapPriorityQueue, but items on even levels
+    are no larger than their descendants and items on odd levels no smaller,
+    so the minimum is at the root and the maximum is one of its children.
+    add, remove_min and remove_max take O(log n) time.
+    """
+
+    def is_min_level(self, j):
+        """Return True if index j lies on an even (min) level"""
+        return (j+1).bit_length() % 2 == 1
+
+    def sift_up(self, j):
+        data = self.data
+        if j == 0:
+            return
+        parent = (j-1) // 2
+        if self.is_min_level(j):
+            if data[parent] < data[j]:
+                data[j], data[parent] = data[parent], data[j]
+                self.push_up(parent, True)
+            else:
+                self.push_up(j, False)
+        else:
+            if data[j] < data[parent]:
+                data[j], data[parent] = data[parent], data[j]
+                self.push_up(parent, False)
+            else:
+                self.push_up(j, True)
+
+    def push_up(self, j, to_max):
+        """Move index j up through its grandparents toward the max or min end"""
+        data = self.data
+        while j > 2:
+            grand = (j-3) // 4
+            if (data[grand] < data[j]) if to_max else (data[j] < data[grand]):
+                data[j], data[grand] = data[grand], data[j]
+                j = grand
             else:
-                self.swap(j, len(self)-1)
-                self.data.pop()
-                self.bubble(j)
-            return (loc.key, loc.value)
+                break
+
+    def sift_down(self, j):
+        data = self.data
+        n = len(data)
+        to_max = not self.is_min_level(j)
+        while 2*j + 1 < n:
+            best = 2*j + 1
+            candidates = [2*j + 2] + list(range(4*j + 3, min(4*j + 7, n)))
+            for c in candidates:
+                if c < n and ((data[best] < data[c]) if to_max else (data[c] < data[best])):
+                    best = c
+            if not ((data[j] < data[best]) if to_max else (data[best] < data[j])):
+                break
+            data[j], data[best] = data[best], data[j]
+            if best <= 2*j + 2:
+                break
+            parent = (best-1) // 2
+            if (data[best] < data[parent]) if to_max else (data[parent] < data[best]):
+                data[best], data[parent] = data[parent], data[best]
+            j = best
+
+    def max_index(self):
+        """Return the index of an item with maximum key"""
+        if len(self.data) < 3:
+            return len(self.data) - 1
+        return 2 if self.data[1] < self.data[2] else 1
+
+    def max(self):
+        """Return but do not remove (k,v) tuple with maximum key"""
+        if self.is_empty():
+            raise Exception('Priority queue is empty')
+        item = self.data[self.max_index()]
+        return (item.key, item.value)
+
+    def remove_max(self):
+        """Remove and return (k,v) tuple with maximum key"""
+        if self.is_empty():
+            raise Exception('Priority queue is empty')
+        j = self.max_index()
+        item = self.data[j]
+        last = self.data.pop()
+        if j < len(self.data):
+            self.data[j] = last
+            self.sift_down(j)
+        return (item.key, item.value)
@@ -0,0 +1,126 @@
+class TimingWheel:
+    """Hierarchical timing wheel for large numbers of timers
+
+    Time is divided into ticks of the given resolution. Level l of the wheel
+    has wheel_size slots, each spanning wheel_size**l ticks; a timer is kept
+    in the lowest level whose range covers its distance from the current
+    tick and moves down a level each time its higher slot comes due.
+    schedule, cancel and reschedule take O(1) time; advance takes time
+    proportional to the ticks passed plus the timers moved or expired.
+    """
+
+    class Timer:
+        """Handle for a scheduled timer"""
+        __slots__ = 'when', 'tick', 'value', 'slot'
+
+        def __init__(self, when, tick, value):
+            self.when = when
+            self.tick = tick
+            self.value = value
+            self.slot = None
+
+        def is_active(self):
+            """Return True if the timer has neither expired nor been cancelled"""
+            return self.slot is not None
+
+    def __init__(self, resolution=1.0, wheel_size=256, levels=4, start=0):
+        """Create an empty wheel whose current time is start
+        wheel_size must be a power of two"""
+        if wheel_size < 2 or wheel_size & (wheel_size - 1):
+            raise ValueError('wheel_size must be a power of two')
+        if resolution <= 0 or levels < 1:
+            raise ValueError('resolution and levels must be positive')
+        self.resolution = resolution
+        self.bits = wheel_size.bit_length() - 1
+        self.mask = wheel_size - 1
+        self.levels = levels
+        self.wheels = [[{} for _ in range(wheel_size)] for _ in range(levels)]
+        self.overflow = {}
+        self.due = {}
+        self.now = self.to_tick(start)
+        self.size = 0
+
+    def __len__(self):
+        """Return the number of active timers"""
+        return self.size
+
+    def to_tick(self, when):
+        """Return the tick containing time when"""
+        return int(when // self.resolution)
+
+    def place(self, timer):
+        """Put timer in the slot matching its distance from the current tick"""
+        delta = timer.tick - self.now
+        if delta <= 0:
+            slot = self.due
+        else:
+            slot = self.overflow
+            for level in range(self.levels):
+                if delta >> (self.bits * (level+1)) == 0:
+                    slot = self.wheels[level][(timer.tick >> (self.bits * level)) & self.mask]
+                    break
+        slot[timer] = None
+        timer.slot = slot
+
+    def schedule(self, when, value):
+        """Schedule value to expire at time when and return its Timer"""
+        timer = self.Timer(when, self.to_tick(when), value)
+        self.place(timer)
+        self.size += 1
+        return timer
+
+    def cancel(self, timer):
+        """Cancel an active timer"""
+        if timer.slot is None:
+            raise ValueError('Timer is not active')
+        del timer.slot[timer]
+        timer.slot = None
+        self.size -= 1
+
+    def reschedule(self, timer, when):
+        """Move an active timer to expire at time when instead"""
+        if timer.slot is None:
+            raise ValueError('Timer is not active')
+        del timer.slot[timer]
+        timer.when = when
+        timer.tick = self.to_tick(when)
+        self.place(timer)
+
+    def cascade(self, slot):
+        """Re-place every timer of a higher-level slot that has come due"""
+        timers = list(slot)
+        slot.clear()
+        for timer in timers:
+            self.place(timer)
+
+    def collect(self, slot, expired):
+        """Move every timer of slot into the expired list"""
+        for timer in slot:
+            timer.slot = None
+            expired.append((timer.when, timer.value))
+        self.size -= len(slot)
+        slot.clear()
+
+    def advance(self, now):
+        """Advance the wheel to time now
+        Return a list of (when, value) pairs for all timers that expired"""
+        target = self.to_tick(now)
+        expired = []
+        self.collect(self.due, expired)
+        while self.now < target:
+            if self.size == 0:
+                self.now = target
+                break
+            self.now += 1
+            tick = self.now
+            level = 0
+            while level + 1 < self.levels and (tick >> (self.bits * (level+1))) << (self.bits * (level+1)) == tick:
+                level += 1
+            if level + 1 == self.levels and (tick >> (self.bits * self.levels)) << (self.bits * self.levels) == tick:
+                self.cascade(self.overflow)
+            while level > 0:
+                self.cascade(self.wheels[level][(tick >> (self.bits * level)) & self.mask])
+                level -= 1
+            self.collect(self.wheels[0][tick & self.mask], expired)
+            self.collect(self.due, expired)
+        return expired
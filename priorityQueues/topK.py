@@ -0,0 +1,95 @@
+from priorityQueues.priorityQueue import HeapPriorityQueue
+
+class TopK:
+    """Bounded accumulator of the k best items seen in a stream
+
+    A heap of at most k entries is kept whose root is the worst kept item,
+    so an item that does not beat that threshold is rejected with a single
+    comparison. Items are scored by key(item), or by themselves if key is
+    None; the largest scores are kept unless largest is False.
+    """
+
+    class Reversed:
+        """Wrapper inverting the order of a score, for smallest-k selection"""
+        __slots__ = 'score'
+
+        def __init__(self, score):
+            self.score = score
+
+        def __lt__(self, other):
+            return other.score < self.score
+
+    def __init__(self, k, key=None, largest=True):
+        """Create an empty accumulator keeping the k best items"""
+        if k < 1:
+            raise ValueError('k must be positive')
+        self.k = k
+        self.key = key
+        self.largest = largest
+        self.heap = HeapPriorityQueue()
+
+    def __len__(self):
+        """Return the number of items currently kept"""
+        return len(self.heap)
+
+    def threshold(self):
+        """Return the score an item must beat to be kept
+        Return None while fewer than k items are kept"""
+        if len(self.heap) < self.k:
+            return None
+        key = self.heap.min()[0]
+        return key if self.largest else key.score
+
+    def accepts(self, score):
+        """Return True if an item with the given score would be kept"""
+        limit = self.threshold()
+        if limit is None:
+            return True
+        return limit < score if self.largest else score < limit
+
+    def add_scored(self, score, item):
+        """Offer item with a precomputed score; return True if it was kept"""
+        if len(self.heap) < self.k:
+            self.heap.add(score if self.largest else self.Reversed(score), item)
+            return True
+        if not self.accepts(score):
+            return False
+        self.heap.replace(score if self.largest else self.Reversed(score), item)
+        return True
+
+    def add(self, item):
+        """Offer item; return True if it was kept"""
+        return self.add_scored(item if self.key is None else self.key(item), item)
+
+    def add_many(self, items):
+        """Offer every item of an iterable such as an array chunk
+        Return the number of items kept"""
+        key, largest = self.key, self.largest
+        kept = 0
+        limit = self.threshold()
+        for item in items:
+            score = item if key is None else key(item)
+            if limit is not None and not (limit < score if largest else score < limit):
+                continue
+            self.add_scored(score, item)
+            kept += 1
+            if len(self.heap) == self.k:
+                limit = self.threshold()
+        return kept
+
+    def scored_items(self):
+        """Generate (score, item) pairs for the kept items in heap order"""
+        for entry in self.heap.data:
+            yield (entry.key if self.largest else entry.key.score, entry.value)
+
+    def merge(self, other):
+        """Combine the kept items of another TopK, e.g. a worker's partial result"""
+        if other.largest != self.largest:
+            raise ValueError('Cannot merge TopK selectors of opposite order')
+        for score, item in list(other.scored_items()):
+            self.add_scored(score, item)
+
+    def items(self):
+        """Return a list of the kept items, best first"""
+        ordered = sorted(self.scored_items(), key=lambda pair: pair[0], reverse=self.largest)
+        return [item for score, item in ordered]
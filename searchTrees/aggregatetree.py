@@ -0,0 +1,89 @@
+from operator import add
+from searchTrees.treemap import RedBlackTreeMap
+
+class AggregateTreeMap(RedBlackTreeMap):
+    """Sorted map that answers range aggregates over keys in O(log n) time
+
+    Every node stores the combination of measure(key, value) over its
+    subtree under an associative combine function with the given identity,
+    for instance (add, 0) for sums, (min, float('inf')) for minima, or
+    (add, 0) with measure lambda k, v: 1 for counts. combine need not be
+    commutative; items are always combined in key order.
+    """
+
+    class Node(RedBlackTreeMap.Node):
+        """Node class that caches the aggregate of its subtree"""
+        __slots__ = 'total'
+
+    def __init__(self, combine=add, identity=0, measure=None):
+        """Create an empty map; measure defaults to the value of an item"""
+        super().__init__()
+        self.combine = combine
+        self.identity = identity
+        self.measure = measure if measure is not None else lambda k, v: v
+
+    def empty_copy(self):
+        return type(self)(self.combine, self.identity, self.measure)
+
+    def update_node(self, node):
+        super().update_node(node)
+        total = self.measure(node.element.key, node.element.value)
+        if node.left is not None:
+            total = self.combine(node.left.total, total)
+        if node.right is not None:
+            total = self.combine(total, node.right.total)
+        node.total = total
+
+    def subtree_total(self, node):
+        """Return the aggregate of node's subtree"""
+        return node.total if node is not None else self.identity
+
+    def aggregate(self, start=None, stop=None):
+        """Return the aggregate of all items with start <= key < stop
+        None for start or stop leaves that end of the range open"""
+        node = self.root
+        while node is not None:
+            key = node.element.key
+            if stop is not None and not key < stop:
+                node = node.left
+            elif start is not None and key < start:
+                node = node.right
+            else:
+                break
+        if node is None:
+            return self.identity
+        total = self.measure(node.element.key, node.element.value)
+        total = self.combine(self.suffix_total(node.left, start), total)
+        return self.combine(total, self.prefix_total(node.right, stop))
+
+    def suffix_total(self, node, start):
+        """Return the aggregate of the items of node's subtree with key >= start"""
+        total = self.identity
+        while node is not None:
+            if start is None:
+                return self.combine(node.total, total)
+            if node.element.key < start:
+                node = node.right
+            else:
+                here = self.measure(node.element.key, node.element.value)
+                total = self.combine(self.combine(here, self.subtree_total(node.right)), total)
+                node = node.left
+        return total
+
+    def prefix_total(self, node, stop):
+        """Return the aggregate of the items of node's subtree with key < stop"""
+        total = self.identity
+        while node is not None:
+            if stop is None:
+                return self.combine(total, node.total)
+            if node.element.key < stop:
+                here = self.measure(node.element.key, node.element.value)
+                total = self.combine(total, self.combine(self.subtree_total(node.left), here))
+                node = node.right
+            else:
+                node = node.left
+        return total
+
+    def total(self):
+        """Return the aggregate of the whole map"""
+        return self.subtree_total(self.root)
@@ -0,0 +1,285 @@
+from bisect import bisect_left, bisect_right
+from hashTables.maps import MapBase
+
+class BPlusTreeMap(MapBase):
+    """Sorted map implementation using a B+ tree
+
+    Keys and values are stored in parallel lists inside leaf nodes that are
+    linked in key order; internal nodes hold separator keys and children.
+    Every node other than the root keeps between fanout // 2 and fanout
+    entries, so the height is O(log n / log fanout).
+    """
+
+    class Leaf:
+        """Leaf node holding sorted keys, their values and sibling links"""
+        __slots__ = 'keys', 'values', 'next', 'prev'
+
+        def __init__(self, keys=None, values=None):
+            self.keys = keys if keys is not None else []
+            self.values = values if values is not None else []
+            self.next = None
+            self.prev = None
+
+    class Internal:
+        """Internal node: keys[i] separates children[i] from children[i+1]"""
+        __slots__ = 'keys', 'children'
+
+        def __init__(self, keys, children):
+            self.keys = keys
+            self.children = children
+
+    def __init__(self, fanout=64):
+        """Create an empty map whose nodes hold up to fanout entries"""
+        if fanout < 4:
+            raise ValueError('fanout must be at least 4')
+        self.fanout = fanout
+        self.root = self.Leaf()
+        self.size = 0
+
+    @classmethod
+    def from_sorted(cls, items, fanout=64):
+        """Build a map in O(n) time from (key, value) pairs in increasing key order"""
+        tree = cls(fanout)
+        items = list(items)
+        for j in range(1, len(items)):
+            if not items[j-1][0] < items[j][0]:
+                raise ValueError('Keys must be strictly increasing')
+        if not items:
+            return tree
+        level = []
+        previous = None
+        for chunk in tree.chunks(items):
+            leaf = cls.Leaf([k for k, v in chunk], [v for k, v in chunk])
+            leaf.prev = previous
+            if previous is not None:
+                previous.next = leaf
+            previous = leaf
+            level.append((leaf.keys[0], leaf))
+        while len(level) > 1:
+            level = [(chunk[0][0], cls.Internal([k for k, node in chunk[1:]], [node for k, node in chunk]))
+                     for chunk in tree.chunks(level)]
+        tree.root = level[0][1]
+        tree.size = len(items)
+        return tree
+
+    def chunks(self, seq):
+        """Split seq into evenly sized runs of at most fanout entries"""
+        count = -(-len(seq) // self.fanout)
+        base, extra = divmod(len(seq), count)
+        result = []
+        start = 0
+        for j in range(count):
+            stop = start + base + (1 if j < extra else 0)
+            result.append(seq[start:stop])
+            start = stop
+        return result
+
+    def __len__(self):
+        """Return number of items in the map"""
+        return self.size
+
+    def find_leaf(self, k):
+        """Return the leaf whose key range contains k"""
+        node = self.root
+        while type(node) is self.Internal:
+            node = node.children[bisect_right(node.keys, k)]
+        return node
+
+    def first_leaf(self):
+        """Return the leaf holding the minimum key"""
+        node = self.root
+        while type(node) is self.Internal:
+            node = node.children[0]
+        return node
+
+    def last_leaf(self):
+        """Return the leaf holding the maximum key"""
+        node = self.root
+        while type(node) is self.Internal:
+            node = node.children[-1]
+        return node
+
+    def __getitem__(self, k):
+        """Return value associated with key k"""
+        leaf = self.find_leaf(k)
+        j = bisect_left(leaf.keys, k)
+        if j == len(leaf.keys) or leaf.keys[j] != k:
+            raise KeyError('Key Error: ' + repr(k))
+        return leaf.values[j]
+
+    def __setitem__(self, k, v):
+        """Assign value v to key k, overwriting existing value if present"""
+        split = self.insert(self.root, k, v)
+        if split is not None:
+            separator, node = split
+            self.root = self.Internal([separator], [self.root, node])
+
+    def insert(self, node, k, v):
+        """Insert k into node's subtree; return (separator, new sibling) on split"""
+        if type(node) is self.Leaf:
+            j = bisect_left(node.keys, k)
+            if j < len(node.keys) and node.keys[j] == k:
+                node.values[j] = v
+                return None
+            node.keys.insert(j, k)
+            node.values.insert(j, v)
+            self.size += 1
+            if len(node.keys) <= self.fanout:
+                return None
+            mid = len(node.keys) // 2
+            sibling = self.Leaf(node.keys[mid:], node.values[mid:])
+            del node.keys[mid:]
+            del node.values[mid:]
+            sibling.next = node.next
+            if node.next is not None:
+                node.next.prev = sibling
+            node.next = sibling
+            sibling.prev = node
+            return (sibling.keys[0], sibling)
+        j = bisect_right(node.keys, k)
+        split = self.insert(node.children[j], k, v)
+        if split is None:
+            return None
+        node.keys.insert(j, split[0])
+        node.children.insert(j+1, split[1])
+        if len(node.children) <= self.fanout:
+            return None
+        mid = len(node.keys) // 2
+        separator = node.keys[mid]
+        sibling = self.Internal(node.keys[mid+1:], node.children[mid+1:])
+        del node.keys[mid:]
+        del node.children[mid+1:]
+        return (separator, sibling)
+
+    def __delitem__(self, k):
+        """Remove item associated with key k"""
+        self.remove(self.root, k)
+        if type(self.root) is self.Internal and len(self.root.children) == 1:
+            self.root = self.root.children[0]
+
+    def remove(self, node, k):
+        """Remove k from node's subtree; return True if node is now underfull"""
+        if type(node) is self.Leaf:
+            j = bisect_left(node.keys, k)
+            if j == len(node.keys) or node.keys[j] != k:
+                raise KeyError('Key Error: ' + repr(k))
+            del node.keys[j]
+            del node.values[j]
+            self.size -= 1
+            return len(node.keys) < self.fanout // 2
+        j = bisect_right(node.keys, k)
+        if self.remove(node.children[j], k):
+            self.fix_underflow(node, j)
+        return len(node.children) < self.fanout // 2
+
+    def entries(self, node):
+        """Return the number of keys of a leaf or children of an internal node"""
+        return len(node.keys) if type(node) is self.Leaf else len(node.children)
+
+    def fix_underflow(self, parent, j):
+        """Refill underfull child j of parent from a sibling, or merge them"""
+        child = parent.children[j]
+        minimum = self.fanout // 2
+        if j > 0 and self.entries(parent.children[j-1]) > minimum:
+            left = parent.children[j-1]
+            if type(child) is self.Leaf:
+                child.keys.insert(0, left.keys.pop())
+                child.values.insert(0, left.values.pop())
+                parent.keys[j-1] = child.keys[0]
+            else:
+                child.keys.insert(0, parent.keys[j-1])
+                child.children.insert(0, left.children.pop())
+                parent.keys[j-1] = left.keys.pop()
+        elif j + 1 < len(parent.children) and self.entries(parent.children[j+1]) > minimum:
+            right = parent.children[j+1]
+            if type(child) is self.Leaf:
+                child.keys.append(right.keys.pop(0))
+                child.values.append(right.values.pop(0))
+                parent.keys[j] = right.keys[0]
+            else:
+                child.keys.append(parent.keys[j])
+                child.children.append(right.children.pop(0))
+                parent.keys[j] = right.keys.pop(0)
+        else:
+            if j > 0:
+                j -= 1
+            left, right = parent.children[j], parent.children[j+1]
+            if type(left) is self.Leaf:
+                left.keys.extend(right.keys)
+                left.values.extend(right.values)
+                left.next = right.next
+                if right.next is not None:
+                    right.next.prev = left
+            else:
+                left.keys.append(parent.keys[j])
+                left.keys.extend(right.keys)
+                left.children.extend(right.children)
+            del parent.keys[j]
+            del parent.children[j+1]
+
+    def __iter__(self):
+        """Generate keys of the map ordered from minimum to maximum"""
+        leaf = self.first_leaf()
+        while leaf is not None:
+            for k in leaf.keys:
+                yield k
+            leaf = leaf.next
+
+    def find_min(self):
+        """Return (key,value) pair with minimum key (or None if empty)"""
+        if self.size == 0:
+            return None
+        leaf = self.first_leaf()
+        return (leaf.keys[0], leaf.values[0])
+
+    def find_max(self):
+        """Return (key,value) pair with maximum key (or None if empty)"""
+        if self.size == 0:
+            return None
+        leaf = self.last_leaf()
+        return (leaf.keys[-1], leaf.values[-1])
+
+    def find_ge(self, k):
+        """Return (key,value) pair with least key greater than or equal to k"""
+        leaf = self.find_leaf(k)
+        j = bisect_left(leaf.keys, k)
+        if j == len(leaf.keys):
+            leaf = leaf.next
+            j = 0
+        return (leaf.keys[j], leaf.values[j]) if leaf is not None else None
+
+    def find_range(self, start, stop):
+        """Iterate all (key, value) pairs such that start <= key < stop
+        if start is None, iteration begins with minimum key of map.
+        if stop is None, iteration continues through the maximum key of map"""
+        if start is None:
+            leaf, j = self.first_leaf(), 0
+        else:
+            leaf = self.find_leaf(start)
+            j = bisect_left(leaf.keys, start)
+        while leaf is not None:
+            keys = leaf.keys
+            end = len(keys) if stop is None else bisect_left(keys, stop, j)
+            for i in range(j, end):
+                yield (keys[i], leaf.values[i])
+            if end < len(keys):
+                return
+            leaf, j = leaf.next, 0
+
+    def items_between(self, start, stop):
+        """Return a list of all (key, value) pairs such that start <= key < stop
+        None for start or stop leaves that end of the range open"""
+        result = []
+        if start is None:
+            leaf, j = self.first_leaf(), 0
+        else:
+            leaf = self.find_leaf(start)
+            j = bisect_left(leaf.keys, start)
+        while leaf is not None:
+            keys = leaf.keys
+            end = len(keys) if stop is None else bisect_left(keys, stop, j)
+            result.extend(zip(keys[j:end], leaf.values[j:end]))
+            if end < len(keys):
+                break
+            leaf, j = leaf.next, 0
+        return result
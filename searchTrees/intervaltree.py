@@ -0,0 +1,79 @@
+from searchTrees.treemap import RedBlackTreeMap
+
+class IntervalTreeMap(RedBlackTreeMap):
+    """Map from half-open intervals [start, end) to values, with overlap queries
+
+    Keys are (start, end) pairs ordered lexicographically in a red-black
+    tree. Every node also stores the largest end in its subtree, so a query
+    skips each subtree whose intervals all end before the query begins.
+    A query reporting k intervals visits O((k + 1) log n) nodes.
+    """
+
+    class Node(RedBlackTreeMap.Node):
+        """Node class that caches the largest interval end in its subtree"""
+        __slots__ = 'max_end'
+
+    def update_node(self, node):
+        super().update_node(node)
+        max_end = node.element.key[1]
+        for child in (node.left, node.right):
+            if child is not None and max_end < child.max_end:
+                max_end = child.max_end
+        node.max_end = max_end
+
+    def __setitem__(self, k, v):
+        """Assign value v to interval k = (start, end), which must have start < end"""
+        start, end = k
+        if not start < end:
+            raise ValueError('Interval must have start < end')
+        super().__setitem__((start, end), v)
+
+    def insert(self, start, end, value=None):
+        """Add interval [start, end) with the given value"""
+        self[start, end] = value
+
+    def remove(self, start, end):
+        """Remove interval [start, end) and return its value"""
+        return self.pop((start, end))
+
+    def search(self, start, stop, closed, result):
+        """Append to result the (interval, value) pairs whose interval starts
+        before stop (or at stop if closed) and ends after start, in key order"""
+        stack = []
+        node = self.root
+        while True:
+            if node is not None and start < node.max_end:
+                stack.append(node)
+                node = node.left
+            elif stack:
+                node = stack.pop()
+                item = node.element
+                begin, end = item.key
+                if stop < begin or (begin == stop and not closed):
+                    break
+                if start < end:
+                    result.append((item.key, item.value))
+                node = node.right
+            else:
+                break
+        return result
+
+    def overlapping(self, start, stop):
+        """Return a list of (interval, value) pairs for intervals overlapping [start, stop)"""
+        if not start < stop:
+            return []
+        return self.search(start, stop, False, [])
+
+    def stabbing(self, x):
+        """Return a list of (interval, value) pairs for intervals containing point x"""
+        return self.search(x, x, True, [])
+
+    def overlapping_batch(self, ranges):
+        """Return one overlapping list for each (start, stop) pair of ranges"""
+        search = self.search
+        return [search(start, stop, False, []) if start < stop else [] for start, stop in ranges]
+
+    def stabbing_batch(self, points):
+        """Return one stabbing list for each point of points"""
+        search = self.search
+        return [search(x, x, True, []) for x in points]
@@ -0,0 +1,193 @@
+from hashTables.maps import MapBase
+
+class PersistentTreeMap(MapBase):
+    """Sorted map stored in an AVL tree of immutable, shared nodes
+
+    An update copies only the O(log n) nodes on the path to the changed key
+    and installs the new (root, size) version with a single assignment, so
+    every earlier version remains complete and unchanging. snapshot() takes
+    O(1) time and returns an independent map of the current version; readers
+    of a snapshot need no locking while another thread updates the original.
+    Nodes have no parent links, so a version is reclaimed as soon as nothing
+    refers to it.
+    """
+
+    class Node:
+        """Immutable tree node"""
+        __slots__ = 'key', 'value', 'left', 'right', 'height'
+
+        def __init__(self, key, value, left=None, right=None):
+            self.key = key
+            self.value = value
+            self.left = left
+            self.right = right
+            self.height = 1 + max(left.height if left is not None else 0,
+                                  right.height if right is not None else 0)
+
+    def __init__(self):
+        """Create an empty map"""
+        self.current = (None, 0)
+
+    def __len__(self):
+        """Return number of items in the map"""
+        return self.current[1]
+
+    def version(self, current):
+        """Return a new map object for the given (root, size) version"""
+        result = type(self)()
+        result.current = current
+        return result
+
+    def snapshot(self):
+        """Return an independent map holding the current version, in O(1) time"""
+        return self.version(self.current)
+
+    def height(self, node):
+        return node.height if node is not None else 0
+
+    def balance(self, key, value, left, right):
+        """Return a new node for key between left and right, rotating if the
+        heights of left and right differ by two"""
+        Node = self.Node
+        if self.height(left) > self.height(right) + 1:
+            if self.height(left.left) >= self.height(left.right):
+                return Node(left.key, left.value, left.left, Node(key, value, left.right, right))
+            middle = left.right
+            return Node(middle.key, middle.value, Node(left.key, left.value, left.left, middle.left),
+                        Node(key, value, middle.right, right))
+        if self.height(right) > self.height(left) + 1:
+            if self.height(right.right) >= self.height(right.left):
+                return Node(right.key, right.value, Node(key, value, left, right.left), right.right)
+            middle = right.left
+            return Node(middle.key, middle.value, Node(key, value, left, middle.left),
+                        Node(right.key, right.value, middle.right, right.right))
+        return Node(key, value, left, right)
+
+    def insert(self, node, k, v):
+        """Return (root of node's subtree with k mapped to v, True if k was added)"""
+        if node is None:
+            return self.Node(k, v), True
+        if k == node.key:
+            return self.Node(k, v, node.left, node.right), False
+        if k < node.key:
+            child, added = self.insert(node.left, k, v)
+            return self.balance(node.key, node.value, child, node.right), added
+        child, added = self.insert(node.right, k, v)
+        return self.balance(node.key, node.value, node.left, child), added
+
+    def remove_min(self, node):
+        """Return (root of node's subtree without its minimum, minimum node)"""
+        if node.left is None:
+            return node.right, node
+        child, smallest = self.remove_min(node.left)
+        return self.balance(node.key, node.value, child, node.right), smallest
+
+    def remove(self, node, k):
+        """Return root of node's subtree without key k; raise KeyError if absent"""
+        if node is None:
+            raise KeyError('Key Error: ' + repr(k))
+        if k == node.key:
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            right, successor = self.remove_min(node.right)
+            return self.balance(successor.key, successor.value, node.left, right)
+        if k < node.key:
+            return self.balance(node.key, node.value, self.remove(node.left, k), node.right)
+        return self.balance(node.key, node.value, node.left, self.remove(node.right, k))
+
+    def updated(self, k, v):
+        """Return a new map with k mapped to v, leaving this map unchanged"""
+        root, size = self.current
+        root, added = self.insert(root, k, v)
+        return self.version((root, size + 1 if added else size))
+
+    def removed(self, k):
+        """Return a new map without key k, leaving this map unchanged"""
+        root, size = self.current
+        return self.version((self.remove(root, k), size - 1))
+
+    def __setitem__(self, k, v):
+        """Assign value v to key k by installing a new version"""
+        root, size = self.current
+        root, added = self.insert(root, k, v)
+        self.current = (root, size + 1 if added else size)
+
+    def __delitem__(self, k):
+        """Remove item associated with key k by installing a new version"""
+        root, size = self.current
+        self.current = (self.remove(root, k), size - 1)
+
+    def __getitem__(self, k):
+        """Return value associated with key k"""
+        node = self.current[0]
+        while node is not None:
+            if k == node.key:
+                return node.value
+            node = node.left if k < node.key else node.right
+        raise KeyError('Key Error: ' + repr(k))
+
+    def __iter__(self):
+        """Generate keys of the version current when iteration starts, in order"""
+        for key, value in self.find_range(None, None):
+            yield key
+
+    def find_min(self):
+        """Return (key,value) pair with minimum key (or None if empty)"""
+        node = self.current[0]
+        if node is None:
+            return None
+        while node.left is not None:
+            node = node.left
+        return (node.key, node.value)
+
+    def find_max(self):
+        """Return (key,value) pair with maximum key (or None if empty)"""
+        node = self.current[0]
+        if node is None:
+            return None
+        while node.right is not None:
+            node = node.right
+        return (node.key, node.value)
+
+    def find_ge(self, k):
+        """Return (key,value) pair with least key greater than or equal to k"""
+        node = self.current[0]
+        candidate = None
+        while node is not None:
+            if k == node.key:
+                return (node.key, node.value)
+            if k < node.key:
+                candidate = node
+                node = node.left
+            else:
+                node = node.right
+        return (candidate.key, candidate.value) if candidate is not None else None
+
+    def find_range(self, start, stop):
+        """Iterate all (key, value) pairs such that start <= key < stop
+        if start is None, iteration begins with minimum key of map.
+        if stop is None, iteration continues through the maximum key of map"""
+        stack = []
+        node = self.current[0]
+        while node is not None:
+            if start is None or not node.key < start:
+                stack.append(node)
+                node = node.left
+            else:
+                node = node.right
+        while stack:
+            node = stack.pop()
+            if stop is not None and not node.key < stop:
+                return
+            yield (node.key, node.value)
+            node = node.right
+            while node is not None:
+                stack.append(node)
+                node = node.left
+
+    def items_between(self, start, stop):
+        """Return a list of all (key, value) pairs such that start <= key < stop
+        None for start or stop leaves that end of the range open"""
+        return list(self.find_range(start, stop))
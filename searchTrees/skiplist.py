@@ -0,0 +1,250 @@
+from random import Random
+from hashTables.maps import MapBase
+
+class SkipListMap(MapBase):
+    """Sorted map implementation using a skip list
+
+    Every node is on level 0, a linked list of all items in key order, and
+    is promoted to each further level with probability p. Searches descend
+    from the highest level, so operations take O(log n) expected time and
+    updates only relink the predecessors of one node, without rotations.
+    """
+
+    class Node:
+        """Skip list node with a forward link per level and a level-0 back link"""
+        __slots__ = 'key', 'value', 'next', 'prev'
+
+        def __init__(self, key, value, height):
+            self.key = key
+            self.value = value
+            self.next = [None] * height
+            self.prev = None
+
+    class Position:
+        """An abstraction representing the location of a single item"""
+
+        def __init__(self, container, node):
+            """Constructor should not be invoked by user"""
+            self.container = container
+            self.node = node
+
+        def key(self):
+            """Return key of map's key-value pair"""
+            return self.node.key
+
+        def value(self):
+            """Return value of map's key-value pair"""
+            return self.node.value
+
+        def __eq__(self, other):
+            """Return True if other is a Position representing the same location"""
+            return type(other) is type(self) and other.node is self.node
+
+    def __init__(self, p=0.5, max_level=32, seed=None):
+        """Create an empty map whose nodes are promoted with probability p"""
+        if not 0 < p < 1:
+            raise ValueError('p must be between 0 and 1')
+        self.p = p
+        self.max_level = max_level
+        self.random = Random(seed)
+        self.head = self.Node(None, None, max_level)
+        self.level = 1
+        self.size = 0
+
+    @classmethod
+    def from_sorted(cls, items, p=0.5, max_level=32, seed=None):
+        """Build a map in O(n) expected time from (key, value) pairs in increasing key order"""
+        skiplist = cls(p, max_level, seed)
+        head = skiplist.head
+        tails = [head] * max_level
+        for key, value in items:
+            last = tails[0]
+            if last is not head and not last.key < key:
+                raise ValueError('Keys must be strictly increasing')
+            node = cls.Node(key, value, skiplist.random_height())
+            node.prev = last if last is not head else None
+            for level in range(len(node.next)):
+                tails[level].next[level] = node
+                tails[level] = node
+            if len(node.next) > skiplist.level:
+                skiplist.level = len(node.next)
+            skiplist.size += 1
+        return skiplist
+
+    def __len__(self):
+        """Return number of items in the map"""
+        return self.size
+
+    def random_height(self):
+        """Return the number of levels for a new node"""
+        height = 1
+        random = self.random.random
+        while height < self.max_level and random() < self.p:
+            height += 1
+        return height
+
+    def validate(self, p):
+        """Return associated node if position is valid"""
+        if not isinstance(p, self.Position):
+            raise TypeError('p must be proper Position type')
+        if p.container is not self:
+            raise ValueError('p does not belong to this container')
+        if p.node.prev is p.node:
+            raise ValueError('p is no longer valid')
+        return p.node
+
+    def make_position(self, node):
+        """Return Position instance for given node"""
+        return self.Position(self, node) if node is not None else None
+
+    def predecessors(self, k):
+        """Return the list of the last node with key < k on each level"""
+        update = [self.head] * self.level
+        node = self.head
+        for level in range(self.level - 1, -1, -1):
+            following = node.next[level]
+            while following is not None and following.key < k:
+                node = following
+                following = node.next[level]
+            update[level] = node
+        return update
+
+    def lower_node(self, k):
+        """Return the last node with key < k, or the head if there is none"""
+        node = self.head
+        for level in range(self.level - 1, -1, -1):
+            following = node.next[level]
+            while following is not None and following.key < k:
+                node = following
+                following = node.next[level]
+        return node
+
+    def ceiling_node(self, k):
+        """Return the node with least key >= k, or None"""
+        return self.lower_node(k).next[0]
+
+    def __getitem__(self, k):
+        """Return value associated with key k"""
+        node = self.ceiling_node(k)
+        if node is None or node.key != k:
+            raise KeyError('Key Error: ' + repr(k))
+        return node.value
+
+    def __setitem__(self, k, v):
+        """Assign value v to key k, overwriting existing value if present"""
+        update = self.predecessors(k)
+        following = update[0].next[0]
+        if following is not None and following.key == k:
+            following.value = v
+            return
+        node = self.Node(k, v, self.random_height())
+        height = len(node.next)
+        if height > self.level:
+            update.extend([self.head] * (height - self.level))
+            self.level = height
+        for level in range(height):
+            node.next[level] = update[level].next[level]
+            update[level].next[level] = node
+        node.prev = update[0] if update[0] is not self.head else None
+        if following is not None:
+            following.prev = node
+        self.size += 1
+
+    def __delitem__(self, k):
+        """Remove item associated with key k"""
+        update = self.predecessors(k)
+        node = update[0].next[0]
+        if node is None or node.key != k:
+            raise KeyError('Key Error: ' + repr(k))
+        self.unlink(node, update)
+
+    def unlink(self, node, update):
+        """Remove node, given its predecessors on every level"""
+        for level in range(len(node.next)):
+            update[level].next[level] = node.next[level]
+        if node.next[0] is not None:
+            node.next[0].prev = node.prev
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1
+        node.prev = node
+        self.size -= 1
+
+    def delete(self, p):
+        """Remove the item at given Position"""
+        node = self.validate(p)
+        self.unlink(node, self.predecessors(node.key))
+
+    def __iter__(self):
+        """Generate keys of the map ordered from minimum to maximum"""
+        node = self.head.next[0]
+        while node is not None:
+            yield node.key
+            node = node.next[0]
+
+    def first(self):
+        """Return the first Position in the map (or None if empty)"""
+        return self.make_position(self.head.next[0])
+
+    def last(self):
+        """Return the last Position in the map (or None if empty)"""
+        node = self.head
+        for level in range(self.level - 1, -1, -1):
+            while node.next[level] is not None:
+                node = node.next[level]
+        return self.make_position(node if node is not self.head else None)
+
+    def before(self, p):
+        """Return the Position just before p in the natural order
+        Return None if p is the first Position"""
+        return self.make_position(self.validate(p).prev)
+
+    def after(self, p):
+        """Return the Position just after p in the natural order
+        Return None if p is the last Position"""
+        return self.make_position(self.validate(p).next[0])
+
+    def find_position(self, k):
+        """Return Position with least key >= k, or the last Position if there is none"""
+        node = self.lower_node(k)
+        if node.next[0] is not None:
+            node = node.next[0]
+        return self.make_position(node if node is not self.head else None)
+
+    def find_min(self):
+        """Return (key,value) pair with minimum key (or None if empty)"""
+        node = self.head.next[0]
+        return (node.key, node.value) if node is not None else None
+
+    def find_max(self):
+        """Return (key,value) pair with maximum key (or None if empty)"""
+        p = self.last()
+        return (p.key(), p.value()) if p is not None else None
+
+    def find_lt(self, k):
+        """Return (key,value) pair with greatest key strictly less than k"""
+        node = self.lower_node(k)
+        return (node.key, node.value) if node is not self.head else None
+
+    def find_ge(self, k):
+        """Return (key,value) pair with least key greater than or equal to k"""
+        node = self.ceiling_node(k)
+        return (node.key, node.value) if node is not None else None
+
+    def find_range(self, start, stop):
+        """Iterate all (key, value) pairs such that start <= key < stop
+        if start is None, iteration begins with minimum key of map.
+        if stop is None, iteration continues through the maximum key of map"""
+        node = self.head.next[0] if start is None else self.ceiling_node(start)
+        while node is not None and (stop is None or node.key < stop):
+            yield (node.key, node.value)
+            node = node.next[0]
+
+    def items_between(self, start, stop):
+        """Return a list of all (key, value) pairs such that start <= key < stop
+        None for start or stop leaves that end of the range open"""
+        result = []
+        node = self.head.next[0] if start is None else self.ceiling_node(start)
+        while node is not None and (stop is None or node.key < stop):
+            result.append((node.key, node.value))
+            node = node.next[0]
+        return result
@@ -13,17 +13,172 @@ class TreeMap(Tree, MapBase):
             """Return value of map's key-value pair"""
             return self.element().value
 
+    class Cursor:
+        """A movable reference to one node of a TreeMap
+
+        Moving a cursor with next or prev walks the nodes directly, without
+        validation or new Position objects. A cursor past either end of the
+        map refers to no node.
+        """
+        __slots__ = 'container', 'node'
+
+        def __init__(self, container, node):
+            """Constructor should not be invoked by user"""
+            self.container = container
+            self.node = node
+
+        def valid(self):
+            """Return True if the cursor refers to a node of the map"""
+            return self.node is not None and self.node.parent is not self.node
+
+        def key(self):
+            """Return key at the cursor"""
+            return self.node.element.key
+
+        def value(self):
+            """Return value at the cursor"""
+            return self.node.element.value
+
+        def next(self):
+            """Move to the next key in order and return the cursor"""
+            if self.node is None:
+                raise ValueError('Cursor does not refer to a node')
+            self.node = self.container.node_after(self.node)
+            return self
+
+        def prev(self):
+            """Move to the previous key in order and return the cursor"""
+            if self.node is None:
+                raise ValueError('Cursor does not refer to a node')
+            self.node = self.container.node_before(self.node)
+            return self
+
+        def seek(self, k):
+            """Move to the least key greater than or equal to k and return the cursor
+            The search starts from the cursor's node, see TreeMap.ceiling_node for its cost"""
+            start = self.node if self.valid() else None
+            self.node = self.container.ceiling_node(k, start)[0]
+            return self
+
+    finger_search = False
+    finger = None
+
     def subtree_search(self, p, k):
         """Return Position of p's subtree having k, or last node searched"""
-        if k == p.key():
-            return p
-        elif k < p.key():
-            if self.left(p) is not None:
-                return self.subtree_search(self.left(p), k)
-        else:
-            if self.right(p) is not None:
-                return self.subtree_search(self.right(p), k)
-        return p
+        node = self.validate(p)
+        while True:
+            key = node.element.key
+            if k == key:
+                break
+            child = node.left if k < key else node.right
+            if child is None:
+                break
+            node = child
+        return self.make_position(node)
+
+    def ceiling_node(self, k, start=None):
+        """Return (node with least key >= k or None, last node searched)
+
+        If start is a node of the map the search is a finger search: it climbs
+        from start only to the smallest enclosing subtree that can hold k and
+        descends from there. It takes time proportional to the height of the
+        smallest subtree containing both start and k. That is not a worst-case
+        O(log d) bound for keys d apart: neighbours on either side of the root
+        still cost O(log n). A run of searches for successive keys takes O(1)
+        amortized time each, as in an inorder walk.
+        """
+        node = self.root if start is None else start
+        last = None
+        candidate = None
+        if start is not None:
+            key = node.element.key
+            if k < key:
+                while node.parent is not None:
+                    parent = node.parent
+                    if node is parent.right:
+                        key = parent.element.key
+                        if key < k:
+                            break
+                        if key == k:
+                            return parent, parent
+                    node = parent
+            elif key < k:
+                while node.parent is not None:
+                    parent = node.parent
+                    if node is parent.left:
+                        key = parent.element.key
+                        if k < key:
+                            candidate = parent
+                            break
+                        if key == k:
+                            return parent, parent
+                    node = parent
+        while node is not None:
+            last = node
+            key = node.element.key
+            if k == key:
+                return node, node
+            if k < key:
+                candidate = node
+                node = node.left
+            else:
+                node = node.right
+        return candidate, last
+
+    def node_after(self, node):
+        """Return the node just after node in the natural order, or None"""
+        if node.right is not None:
+            node = node.right
+            while node.left is not None:
+                node = node.left
+            return node
+        above = node.parent
+        while above is not None and node is above.right:
+            node = above
+            above = node.parent
+        return above
+
+    def node_before(self, node):
+        """Return the node just before node in the natural order, or None"""
+        if node.left is not None:
+            node = node.left
+            while node.right is not None:
+                node = node.right
+            return node
+        above = node.parent
+        while above is not None and node is above.left:
+            node = above
+            above = node.parent
+        return above
+
+    def first_node(self):
+        """Return the node with the minimum key, or None if empty"""
+        node = self.root
+        if node is not None:
+            while node.left is not None:
+                node = node.left
+        return node
+
+    def finger_start(self):
+        """Return the node where a search should begin
+        With finger_search enabled this is the last node accessed, if still in the map"""
+        finger = self.finger
+        if self.finger_search and finger is not None and finger.parent is not finger:
+            return finger
+        return None
+
+    def seek(self, k):
+        """Return a Cursor at the least key greater than or equal to k
+        The cursor is invalid if there is no such key"""
+        node, last = self.ceiling_node(k, self.finger_start())
+        if last is not None:
+            self.finger = last
+            self.rebalance_access(self.make_position(last))
+        return self.Cursor(self, node)
+
+    def cursor(self):
+        """Return a Cursor at the minimum key"""
+        return self.Cursor(self, self.first_node())
 
     def subtree_first_position(self, p):
         """Return Position of first item in subtree rooted at p"""
@@ -41,11 +196,11 @@ class TreeMap(Tree, MapBase):
 
     def first(self):
         """Return the first Position in the tree"""
-        return self.subtree_first_position(self.root()) if len(self) > 0 else None
+        return self.subtree_first_position(self.root1()) if len(self) > 0 else None
 
     def last(self):
         """Return the last Position in the tree"""
-        return self.subtree_last_position(self.root()) if len(self) > 0 else None
+        return self.subtree_last_position(self.root1()) if len(self) > 0 else None
 
     def before(self, p):
         """Return the Position just before p in the natural order
@@ -80,7 +235,7 @@ class TreeMap(Tree, MapBase):
         if self.is_empty():
             return None
         else:
-            p = self.subtree_search(self.root(), k)
+            p = self.subtree_search(self.root1(), k)
             self.rebalance_access(p)
             return p
 
@@ -94,39 +249,50 @@ class TreeMap(Tree, MapBase):
 
     def find_ge(self, k):
         """Return (key,value) pair with least key greater than or equal to k"""
-        if self.is_empty():
-            return None
-        else:
-            p = self.find_position(k)
-            if p.key()<k:
-                p = self.after(p)
-            return (p.key(), p.value()) if p is not None else None
+        node = self.seek(k).node
+        return (node.element.key, node.element.value) if node is not None else None
+
+    def range_start(self, start):
+        """Return the first node of a range scan beginning at start"""
+        return self.first_node() if start is None else self.seek(start).node
 
     def find_range(self, start, stop):
         """Iterate all (key, value) pairs such that start <= key < stop
         if start is None, iteration begins with minimum key of map.
         if stop is None, iteration continues through the maximum key of map"""
-        if not self.is_empty():
-            if start is None:
-                p = self.first()
-            else:
-                p = self.find_position(start)
-                if p.key() < start:
-                    p = self.after(p)
-            while p is not None and (stop is None or p.key() < stop):
-                yield (p.key(), p.value())
-                p = self.after(p)
+        node = self.range_start(start)
+        while node is not None:
+            item = node.element
+            if stop is not None and not item.key < stop:
+                break
+            yield (item.key, item.value)
+            node = self.node_after(node)
+
+    def items_between(self, start, stop):
+        """Return a list of all (key, value) pairs such that start <= key < stop
+        None for start or stop leaves that end of the range open"""
+        result = []
+        node = self.range_start(start)
+        node_after = self.node_after
+        while node is not None:
+            item = node.element
+            if stop is not None and not item.key < stop:
+                break
+            result.append((item.key, item.value))
+            node = node_after(node)
+        return result
 
     def __getitem__(self, k):
         """Return value associated with key k"""
         if self.is_empty():
             raise KeyError('Key Error: ' + repr(k))
         else:
-            p = self.subtree_search(self.root1(), k)
-            self.rebalance_access(p)
-            if k != p.key():
+            node, last = self.ceiling_node(k, self.finger_start())
+            self.finger = last
+            self.rebalance_access(self.make_position(last))
+            if node is None or k != node.element.key:
                 raise KeyError('Key Error: ' + repr(k))
-            return p.value()
+            return node.element.value
 
     def __setitem__(self, k, v):
         """Assign value v to key k, overwriting existing value if present"""
@@ -136,6 +302,8 @@ class TreeMap(Tree, MapBase):
             p = self.subtree_search(self.root1(), k)
             if p.key() == k:
                 p.element().value = v
+                if self.augmented:
+                    self.update_path(p.node)
                 self.rebalance_access(p)
                 return
             else:
@@ -144,14 +312,16 @@ class TreeMap(Tree, MapBase):
                     leaf = self.add_right(p, item)
                 else:
                     leaf = self.add_left(p, item)
+        if self.augmented:
+            self.update_path(leaf.node)
         self.rebalance_insert(leaf)
 
     def __iter__(self):
         """Generate an iteration of all keys in the map in order"""
-        p = self.first()
-        while p is not None:
-            yield p.key()
-            p = self.after(p)
+        node = self.first_node()
+        while node is not None:
+            yield node.element.key
+            node = self.node_after(node)
 
     def delete(self, p):
         """Remove the item at given Position"""
@@ -161,7 +331,9 @@ class TreeMap(Tree, MapBase):
             self.replace(p, replacement.element())
             p = replacement
         parent = self.parent(p)
-        self.delete(p)
+        super().delete(p)
+        if self.augmented and parent is not None:
+            self.update_path(parent.node)
         self.rebalance_delete(parent)
 
     def __delitem__(self, k):
@@ -174,6 +346,209 @@ class TreeMap(Tree, MapBase):
             self.rebalance_access(p)
         raise KeyError('Key Error: ' + repr(k))
 
+    augmented = False
+
+    def update_node(self, node):
+        """Recompute the augmented fields of node from its children
+        Called bottom-up after every structural change when augmented is True"""
+        pass
+
+    def update_path(self, node):
+        """Recompute augmented fields from node up to the root"""
+        while node is not None:
+            self.update_node(node)
+            node = node.parent
+
+    def subtree_size(self, node):
+        """Return the number of items in the subtree rooted at node"""
+        raise TypeError(type(self).__name__ + ' does not maintain subtree sizes')
+
+    def rank(self, k):
+        """Return the number of keys less than k"""
+        node = self.root
+        result = 0
+        while node is not None:
+            if k <= node.element.key:
+                node = node.left
+            else:
+                result += self.subtree_size(node.left) + 1
+                node = node.right
+        return result
+
+    def select(self, i):
+        """Return (key,value) pair with the i-th smallest key, counting from 0"""
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('Index out of range: ' + repr(i))
+        node = self.root
+        while True:
+            left = self.subtree_size(node.left)
+            if i < left:
+                node = node.left
+            elif i == left:
+                return (node.element.key, node.element.value)
+            else:
+                i -= left + 1
+                node = node.right
+
+    def count_range(self, start, stop):
+        """Return the number of keys k such that start <= k < stop
+        None for start or stop leaves that end of the range open"""
+        high = len(self) if stop is None else self.rank(stop)
+        low = 0 if start is None else self.rank(start)
+        return max(0, high - low)
+
+    @classmethod
+    def from_sorted(cls, items, *args, **kwargs):
+        """Build a balanced map in O(n) time from (key, value) pairs in increasing key order
+        Any other arguments are passed to the constructor"""
+        return cls(*args, **kwargs).load_sorted(items)
+
+    def empty_copy(self):
+        """Return a new empty map of the same type and configuration"""
+        return type(self)()
+
+    def load_sorted(self, items):
+        """Replace the contents of the map by the sorted (key, value) pairs and return it"""
+        items = list(items)
+        for j in range(1, len(items)):
+            if not items[j-1][0] < items[j][0]:
+                raise ValueError('Keys must be strictly increasing')
+        self.root = self.build(items, 0, len(items), 0, len(items).bit_length() - 1)
+        self.size = len(items)
+        self.finger = None
+        return self
+
+    def build(self, items, start, stop, depth, bottom):
+        """Return the root of a perfectly balanced subtree holding items[start:stop]
+        bottom is the depth of the deepest level of the whole tree"""
+        if start == stop:
+            return None
+        mid = (start + stop) // 2
+        node = self.Node(self.Item(items[mid][0], items[mid][1]))
+        self.relink(node, self.build(items, start, mid, depth + 1, bottom), True)
+        self.relink(node, self.build(items, mid + 1, stop, depth + 1, bottom), False)
+        self.init_built_node(node, depth, bottom)
+        if self.augmented:
+            self.update_node(node)
+        return node
+
+    def init_built_node(self, node, depth, bottom):
+        """Set the balance information of a node made by build"""
+        pass
+
+    def balance_height(self, node):
+        """Return the height measure that join_nodes balances for node's subtree"""
+        return 0
+
+    def child_balance_height(self, node, height, child):
+        """Return the balance height of a child of node, given node's balance height"""
+        return 0
+
+    def join_nodes(self, left, left_height, node, right, right_height):
+        """Join subtrees left and right with node between them
+        Keys of left must be less than node's key and keys of right greater.
+        Return (root, balance height) of the joined subtree."""
+        node.parent = None
+        self.relink(node, left, True)
+        self.relink(node, right, False)
+        if self.augmented:
+            self.update_node(node)
+        return node, 0
+
+    def split_nodes(self, node, height, k):
+        """Split node's subtree into subtrees with the keys less than k and the rest
+        Return (left root, left balance height, right root, right balance height)"""
+        if node is None:
+            return None, 0, None, 0
+        left, right = node.left, node.right
+        left_height = self.child_balance_height(node, height, left)
+        right_height = self.child_balance_height(node, height, right)
+        for child in (left, right):
+            if child is not None:
+                child.parent = None
+        if k <= node.element.key:
+            low, low_height, high, high_height = self.split_nodes(left, left_height, k)
+            high, high_height = self.join_nodes(high, high_height, node, right, right_height)
+        else:
+            low, low_height, high, high_height = self.split_nodes(right, right_height, k)
+            low, low_height = self.join_nodes(left, left_height, node, low, low_height)
+        return low, low_height, high, high_height
+
+    def split(self, k):
+        """Move the items into two new maps, with the keys less than k and the rest
+        Return the pair of maps; this map is left empty. Takes O(log n) time for
+        AVLTreeMap and RedBlackTreeMap."""
+        total = self.subtree_size(self.root)
+        first, second = self.empty_copy(), self.empty_copy()
+        if total > 0:
+            root = self.root
+            first.root, h, second.root, h = self.split_nodes(root, self.balance_height(root), k)
+            self.root = None
+            first.size = self.subtree_size(first.root)
+            second.size = total - first.size
+            self.size = 0
+            self.finger = None
+        return first, second
+
+    @classmethod
+    def join(cls, left, right):
+        """Move the items of maps left and right into a new map and return it
+        Every key of left must be less than every key of right; both maps are
+        left empty. Takes O(log n) time for AVLTreeMap and RedBlackTreeMap."""
+        if not type(left) is type(right) is cls:
+            raise TypeError('Tree types must match')
+        tree = left.empty_copy()
+        if left.is_empty() or right.is_empty():
+            source = right if left.is_empty() else left
+            tree.root, tree.size = source.root, len(source)
+        else:
+            p = left.last()
+            if not p.key() < right.first().key():
+                raise ValueError('Keys of left must be less than keys of right')
+            tree.size = len(left) + len(right)
+            node = cls.Node(p.element())
+            left.delete(p)
+            tree.root, h = tree.join_nodes(left.root, left.balance_height(left.root), node,
+                                           right.root, right.balance_height(right.root))
+        for source in (left, right):
+            source.root = None
+            source.size = 0
+            source.finger = None
+        return tree
+
+    def union(self, other):
+        """Return a new map holding the items of both maps in linear time
+        Where both maps have a key, the value of other is kept."""
+        a = self.items_between(None, None)
+        b = other.items_between(None, None)
+        items = []
+        i = j = 0
+        while i < len(a) and j < len(b):
+            if a[i][0] < b[j][0]:
+                items.append(a[i])
+                i += 1
+            elif b[j][0] < a[i][0]:
+                items.append(b[j])
+                j += 1
+            else:
+                items.append(b[j])
+                i += 1
+                j += 1
+        items.extend(a[i:])
+        items.extend(b[j:])
+        return self.empty_copy().load_sorted(items)
+
+    def rebalance_insert(self, p):
+        pass
+
+    def rebalance_delete(self, p):
+        pass
+
+    def rebalance_access(self, p):
+        pass
+
     def relink(self, parent, child, make_left_child):
         """Relink parent node with child node"""
         if make_left_child:
@@ -199,6 +574,9 @@ class TreeMap(Tree, MapBase):
         else:
             self.relink(y, x.left, False)
             self.relink(x, y, True)
+        if self.augmented:
+            self.update_node(y)
+            self.update_node(x)
 
     def restructure(self, x):
         """Perform trinode restructure of Position x with parent/grandparent"""
@@ -221,6 +599,7 @@ class AVLTreeMap(TreeMap):
         def __init__(self, element, parent=None, left=None, right=None):
             super().__init__(element, parent, left, right)
             self.height = 0
+            self.size = 1
 
         def left_height(self):
             return self.left.height if self.left is not None else 0
@@ -228,6 +607,47 @@ class AVLTreeMap(TreeMap):
         def right_height(self):
             return self.right.height if self.right is not None else 0
 
+    augmented = True
+
+    def subtree_size(self, node):
+        return node.size if node is not None else 0
+
+    def update_node(self, node):
+        node.size = 1 + self.subtree_size(node.left) + self.subtree_size(node.right)
+
+    def init_built_node(self, node, depth, bottom):
+        node.height = 1 + max(node.left_height(), node.right_height())
+
+    def balance_height(self, node):
+        return node.height if node is not None else 0
+
+    def child_balance_height(self, node, height, child):
+        return self.balance_height(child)
+
+    def join_nodes(self, left, left_height, node, right, right_height):
+        left_height, right_height = self.balance_height(left), self.balance_height(right)
+        if abs(left_height - right_height) <= 1:
+            super().join_nodes(left, left_height, node, right, right_height)
+            node.height = 1 + max(left_height, right_height)
+            return node, node.height
+        taller = left_height > right_height
+        top = left if taller else right
+        shorter_height = right_height if taller else left_height
+        parent, walk = None, top
+        while walk is not None and walk.height > shorter_height + 1:
+            parent, walk = walk, (walk.right if taller else walk.left)
+        if taller:
+            super().join_nodes(walk, 0, node, right, 0)
+        else:
+            super().join_nodes(left, 0, node, walk, 0)
+        self.relink(parent, node, not taller)
+        node.height = 0
+        self.root = top
+        if self.augmented:
+            self.update_path(node)
+        self.rebalance(self.make_position(node))
+        return self.root, self.root.height
+
     def recompute_height(self, p):
         p.node.height = 1 + max(p.node.left_height(), p.node.right_height())
 
@@ -295,11 +715,75 @@ class RedBlackTreeMap(TreeMap):
 
     class Node(TreeMap.Node):
         """Node class for red-black tree maintains bit that denotes color"""
-        __slots__ = 'red'
+        __slots__ = 'red', 'size'
 
         def __init__(self, element, parent=None, left=None, right=None):
             super().__init__(element, parent, left, right)
             self.red = True
+            self.size = 1
+
+    augmented = True
+
+    def subtree_size(self, node):
+        return node.size if node is not None else 0
+
+    def update_node(self, node):
+        node.size = 1 + self.subtree_size(node.left) + self.subtree_size(node.right)
+
+    def init_built_node(self, node, depth, bottom):
+        node.red = 0 < depth == bottom
+
+    def balance_height(self, node):
+        """Return the number of black nodes on a path from node down to a leaf"""
+        height = 0
+        while node is not None:
+            if not node.red:
+                height += 1
+            node = node.left
+        return height
+
+    def child_balance_height(self, node, height, child):
+        return height if node.red else height - 1
+
+    def join_nodes(self, left, left_height, node, right, right_height):
+        for root in (left, right):
+            if root is not None and root.red:
+                root.red = False
+                if root is left:
+                    left_height += 1
+                else:
+                    right_height += 1
+        if left_height == right_height:
+            super().join_nodes(left, left_height, node, right, right_height)
+            node.red = False
+            return node, left_height + 1
+        taller = left_height > right_height
+        top, height = (left, left_height) if taller else (right, right_height)
+        shorter, shorter_height = (right, right_height) if taller else (left, left_height)
+        parent, walk = None, top
+        while walk is not None and (walk.red or height > shorter_height):
+            if not walk.red:
+                height -= 1
+            parent, walk = walk, (walk.right if taller else walk.left)
+        if taller:
+            super().join_nodes(walk, 0, node, right, 0)
+        else:
+            super().join_nodes(left, 0, node, walk, 0)
+        self.relink(parent, node, not taller)
+        node.red = True
+        self.root = top
+        if self.augmented:
+            self.update_path(node)
+        self.resolve_red(self.make_position(node))
+        # the shorter tree is intact below the joined path, so count blacks above it
+        anchor = shorter if shorter is not None else node
+        height = shorter_height if shorter is not None else (0 if node.red else 1)
+        above = anchor.parent
+        while above is not None:
+            if not above.red:
+                height += 1
+            above = above.parent
+        return self.root, height
 
     def set_red(self, p):
         p.node.red = True
@@ -321,7 +805,7 @@ class RedBlackTreeMap(TreeMap):
         for child in (self.left(p), self.right(p)):
             if self.is_red(child):
                 return child
-            return None
+        return None
 
     def rebalance_insert(self, p):
         self.resolve_red(p)
@@ -0,0 +1,61 @@
+from graph import graph
+from priorityQueues.priorityQueue import AdaptableHeapPriorityQueue
+from priorityQueues.priorityQueue import DaryHeapPriorityQueue
+from priorityQueues.priorityQueue import PairingHeapPriorityQueue
+
+BACKENDS = [AdaptableHeapPriorityQueue, lambda: DaryHeapPriorityQueue(3), PairingHeapPriorityQueue]
+
+def test_shortest_paths():
+    G = graph.Graph()
+    a = G.insert_vertex('A')
+    b = G.insert_vertex('B')
+    c = G.insert_vertex('C')
+    d = G.insert_vertex('D')
+    G.insert_edge(a, b, 4)
+    G.insert_edge(a, c, 1)
+    G.insert_edge(c, b, 2)
+    G.insert_edge(b, d, 5)
+    for method in ('heap', 'radix', 'delta'):
+        lengths = graph.shortest_path_lengths(G, a, method=method)
+        print(method, sorted((v.element(), k) for v, k in lengths.items()))
+        try:
+            graph.shortest_path_lengths(G, graph.Vertex('E'), method=method)
+        except ValueError as e:
+            print(method, e)
+test_shortest_paths()
+
+def test_compact_graph():
+    G = graph.CompactGraph(directed=True)
+    a = G.insert_vertex('A')
+    b = G.insert_vertex('B')
+    c = G.insert_vertex('C')
+    G.insert_edge(a, b, 7)
+    G.insert_edge(b, c, 2)
+    print(list(G.vertices()), [G.element(v) for v in G.vertices()])
+    print(G.edge_count(), G.degree(b), G.degree(b, False))
+    lengths = graph.shortest_path_lengths(G, a)
+    print(sorted((G.element(v), k) for v, k in lengths.items()))
+test_compact_graph()
+
+def test_traversal_stats():
+    G = graph.Graph()
+    verts = [G.insert_vertex(i) for i in range(6)]
+    for i in range(1, 6):
+        G.insert_edge(verts[i-1], verts[i], i)
+    with graph.TraversalStats(lambda stats: print(stats.counters, stats.peaks)) as stats:
+        graph.shortest_path_lengths(G, verts[0], stats=stats)
+        graph.BFS(G, verts[0], {verts[0]: None}, stats)
+test_traversal_stats()
+
+def test_queue_backends():
+    G = graph.Graph()
+    verts = [G.insert_vertex(i) for i in range(6)]
+    for i, j, w in [(0, 1, 7), (0, 2, 9), (0, 5, 14), (1, 2, 10), (1, 3, 15),
+                    (2, 3, 11), (2, 5, 2), (3, 4, 6), (4, 5, 9)]:
+        G.insert_edge(verts[i], verts[j], w)
+    for factory in BACKENDS:
+        lengths = graph.shortest_path_lengths(G, verts[0], queue_factory=factory)
+        tree = graph.MST_PrimJarnik(G, queue_factory=factory)
+        print(sorted((v.element(), k) for v, k in lengths.items()),
+              sum(e.element() for e in tree), len(tree))
+test_queue_backends()
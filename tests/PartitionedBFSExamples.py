@@ -0,0 +1,37 @@
+from random import Random
+from graph import graph
+from graph.partitionedbfs import PartitionedBFS
+
+def random_compact_graph(n, m, seed=1, directed=False):
+    rnd = Random(seed)
+    G = graph.CompactGraph(directed)
+    for i in range(n):
+        G.insert_vertex(i)
+    for _ in range(m):
+        u, v = rnd.randrange(n), rnd.randrange(n)
+        if u != v and G.get_edge(u, v) is None:
+            G.insert_edge(u, v)
+    return G
+
+def bfs_levels(G, s):
+    """Return levels found by graph.BFS for comparison"""
+    discovered = {s: None}
+    graph.BFS(G, s, discovered)
+    levels = {s: 0}
+    for v in discovered:
+        path = graph.construct_path(s, v, discovered)
+        levels[v] = len(path) - 1
+    return levels
+
+def test_partitioned_bfs(workers=3):
+    for directed in (False, True):
+        G = random_compact_graph(2000, 5000, directed=directed)
+        with PartitionedBFS(workers, directed) as engine:
+            engine.add_graph(G)
+            levels = engine.bfs(0)
+            print(directed, levels == bfs_levels(G, 0), len(levels), engine.partition_sizes())
+            for depth, sent, received in engine.level_bytes:
+                print('  level', depth, 'sent', sent, 'received', received)
+
+if __name__ == '__main__':
+    test_partitioned_bfs()
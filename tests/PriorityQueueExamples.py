@@ -0,0 +1,196 @@
+import asyncio
+import os
+import tempfile
+import threading
+from random import Random
+from priorityQueues import priorityQueue
+from priorityQueues.externalQueue import ExternalPriorityQueue
+from priorityQueues.timingWheel import TimingWheel
+from priorityQueues.blockingQueue import BlockingPriorityQueue, AsyncPriorityQueue, Empty, Full
+from priorityQueues.topK import TopK
+
+def test_heap_batches():
+    jobs = [(5, 'e'), (1, 'a'), (4, 'd'), (2, 'b'), (3, 'c')]
+    P = priorityQueue.HeapPriorityQueue.from_items(jobs)
+    print(P.min())
+    P.add_many([(0, 'z'), (6, 'f')])
+    print(P.pop_many(3))
+    print(P.pushpop(1, 'x'))
+    print(P.replace(9, 'y'))
+    print(P.pop_many(10))
+test_heap_batches()
+
+def test_indexed_heap():
+    P = priorityQueue.IndexedHeapPriorityQueue.from_keys([7, 3, 9, 1])
+    P.decrease_key(2, 0)
+    P.remove(3)
+    print(P.contains(3), len(P), P.min())
+    while not P.is_empty():
+        print(P.remove_min())
+test_indexed_heap()
+
+def test_top_k():
+    best = TopK(3, key=len)
+    best.add_many(['pear', 'fig', 'banana', 'kiwi', 'cherry', 'plum'])
+    print(best.items(), best.threshold(), best.accepts(3))
+    other = TopK(3, key=len)
+    other.add_many(['watermelon', 'apple'])
+    best.merge(other)
+    print(best.items())
+test_top_k()
+
+def test_min_max_heap():
+    P = priorityQueue.MinMaxHeapPriorityQueue.from_items([(4, 'd'), (9, 'i'), (1, 'a'), (7, 'g')])
+    P.add(5, 'e')
+    print(P.min(), P.max())
+    print(P.remove_max(), P.remove_min(), len(P))
+test_min_max_heap()
+
+def test_adaptable_batches():
+    P = priorityQueue.AdaptableHeapPriorityQueue()
+    a, b, c, d = P.add_many([(1, 'a'), (2, 'b'), (3, 'c'), (4, 'd')])
+    print(P.pop_many(1))
+    P.update(b, 10, 'b')
+    P.update(d, 0, 'd')
+    (removed, e) = P.pushpop(5, 'e')
+    print(removed, P.remove(c))
+    P.update(e, 11, 'e')
+    (removed, f) = P.replace(7, 'f')
+    P.update(e, 1, 'e')
+    P.update(f, 2, 'f')
+    assert all(loc.index == j for j, loc in enumerate(P.data))
+    print(removed, P.pop_many(10))
+test_adaptable_batches()
+
+def test_adaptable_backends():
+    for P in (priorityQueue.DaryHeapPriorityQueue(3), priorityQueue.PairingHeapPriorityQueue()):
+        locs = {c: P.add(k, c) for k, c in [(5, 'e'), (3, 'c'), (8, 'h'), (1, 'a'), (6, 'f'), (4, 'd')]}
+        P.update(locs['h'], 2, 'h')
+        P.update(locs['a'], 7, 'a')
+        print(P.remove(locs['f']), P.min(), len(P))
+        P.update(locs['e'], 0, 'e')
+        print([P.remove_min() for j in range(len(P))])
+test_adaptable_backends()
+
+def test_meld():
+    for cls in (priorityQueue.LeftistHeapPriorityQueue, priorityQueue.SkewHeapPriorityQueue,
+                priorityQueue.PairingHeapPriorityQueue):
+        A, B = cls(), cls()
+        for k in (5, 1, 8, 3):
+            A.add(k, 'a%d' % k)
+        for k in (4, 9, 2, 6):
+            B.add(k, 'b%d' % k)
+        A.meld(B)
+        print(cls.__name__, len(A), len(B), [A.remove_min()[0] for j in range(len(A))])
+    A, B, C = (priorityQueue.PairingHeapPriorityQueue() for j in range(3))
+    a = A.add(5, 'a')
+    b = B.add(7, 'b')
+    c = C.add(3, 'c')
+    stale = B.add(8, 'stale')
+    A.meld(B)
+    C.meld(A)
+    C.update(b, 1, 'b')
+    C.update(a, 9, 'a')
+    print(C.remove(stale), len(C), len(A), len(B))
+    try:
+        B.remove(b)
+    except ValueError:
+        print('locator now belongs to the melded heap')
+    B.add(0, 'new')
+    print([C.remove_min() for j in range(len(C))], B.min())
+test_meld()
+
+def test_external_queue():
+    rnd = Random(7)
+    keys = [rnd.randrange(1000) for j in range(500)]
+    directory = tempfile.mkdtemp()
+    with ExternalPriorityQueue(memory_limit=10, block_size=4, max_runs=3, directory=directory) as P:
+        for j, k in enumerate(keys[:300]):
+            P.add(k, j)
+        print(P.run_count(), [len(tier) for tier in P.tiers])
+        out = [P.remove_min()[0] for j in range(100)]
+        for j, k in enumerate(keys[300:]):
+            P.add(k, j)
+            out.append(P.remove_min()[0])
+        P.compact()
+        print(P.run_count())
+        rest = [P.remove_min()[0] for j in range(len(P))]
+        assert out[:100] == sorted(keys[:300])[:100]
+        assert rest == sorted(rest) and sorted(out + rest) == sorted(keys)
+        for k in keys:
+            P.add(k, None)
+        runs = [run for tier in P.tiers for run in tier]
+        print(len(P), len(runs))
+    assert all(run.file.closed for run in runs) and not os.listdir(directory)
+    os.rmdir(directory)
+    print(len(P), P.run_count())
+test_external_queue()
+
+def test_timing_wheel():
+    W = TimingWheel(resolution=1.0, wheel_size=4, levels=2)
+    near = W.schedule(2.5, 'near')
+    far = W.schedule(9, 'cascades from level 1')
+    beyond = W.schedule(40, 'overflow')
+    dropped = W.schedule(3, 'cancelled')
+    moved = W.schedule(30, 'rescheduled')
+    assert near.slot is W.wheels[0][2] and far.slot is W.wheels[1][2] and beyond.slot is W.overflow
+    W.cancel(dropped)
+    W.reschedule(moved, 5)
+    print(len(W), dropped.is_active())
+    print(W.advance(4))
+    print(W.advance(8), far.slot is W.wheels[0][1])
+    print(W.advance(9), W.advance(39), len(W))
+    print(W.advance(100), beyond.is_active(), len(W))
+test_timing_wheel()
+
+def test_blocking_queue():
+    Q = BlockingPriorityQueue(maxsize=3)
+    Q.put(2, 'first two')
+    Q.put(1, 'one')
+    Q.put(2, 'second two')
+    try:
+        Q.put(0, 'no room', timeout=0.01)
+    except Full:
+        print('full')
+    print(Q.get(), Q.get(), Q.get())
+    try:
+        Q.get(timeout=0.01)
+    except Empty:
+        print('empty')
+    try:
+        Q.get(block=False)
+    except Empty:
+        print('empty')
+    print(Q.get_batch(5, timeout=0.01))
+    consumed = []
+    def consume():
+        while len(consumed) < 20:
+            consumed.extend(Q.get_batch(4))
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    for j in range(20):
+        Q.put(j % 2, j)
+    consumer.join()
+    print(len(consumed), all(a[1] < b[1] for a, b in zip(consumed, consumed[1:]) if a[0] == b[0]))
+test_blocking_queue()
+
+def test_async_queue():
+    async def main():
+        Q = AsyncPriorityQueue(maxsize=2)
+        async def produce():
+            for j in range(10):
+                await Q.put(j % 3, j)
+        async def consume():
+            result = []
+            while len(result) < 10:
+                result.extend(await Q.get_batch(3))
+            return result
+        producer = asyncio.ensure_future(produce())
+        consumed = await consume()
+        await producer
+        print(len(consumed), all(a[1] < b[1] for a, b in zip(consumed, consumed[1:]) if a[0] == b[0]))
+        await Q.put(5, 'x')
+        await Q.put(5, 'y')
+        print(await Q.get(), await Q.get(), await Q.get_batch(1, timeout=0.01))
+    asyncio.run(main())
+test_async_queue()
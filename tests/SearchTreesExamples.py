@@ -0,0 +1,112 @@
+from random import Random
+from searchTrees import treemap
+from searchTrees.bplustree import BPlusTreeMap
+from searchTrees.aggregatetree import AggregateTreeMap
+from searchTrees.intervaltree import IntervalTreeMap
+from searchTrees.persistentmap import PersistentTreeMap
+from searchTrees.skiplist import SkipListMap
+
+def test_cursor():
+    M = treemap.AVLTreeMap()
+    for k in [50, 20, 70, 10, 30, 60, 80]:
+        M[k] = str(k)
+    c = M.seek(25)
+    print(c.key(), c.next().key(), c.prev().prev().key())
+    print(M.items_between(20, 61))
+    print(list(M.find_range(None, 30)), M.find_ge(65))
+test_cursor()
+
+def test_bplustree():
+    M = BPlusTreeMap.from_sorted([(k, k*k) for k in range(20)], fanout=4)
+    M[25] = 625
+    del M[3]
+    print(len(M), M[7], M.find_min(), M.find_max(), M.find_ge(3))
+    print(list(M.find_range(15, 22)))
+test_bplustree()
+
+def checked_size(node):
+    """Return the number of nodes under node, asserting every stored subtree size"""
+    if node is None:
+        return 0
+    size = 1 + checked_size(node.left) + checked_size(node.right)
+    assert node.size == size
+    return size
+
+def test_order_statistics():
+    random = Random(41)
+    for cls in (treemap.AVLTreeMap, treemap.RedBlackTreeMap):
+        M = cls()
+        keys = set()
+        for step in range(2000):
+            k = random.randrange(500)
+            if k in keys and random.random() < 0.5:
+                del M[k]
+                keys.discard(k)
+            else:
+                M[k] = step
+                keys.add(k)
+        ordered = sorted(keys)
+        assert checked_size(M.root) == len(ordered)
+        assert all(M.select(i)[0] == k and M.rank(k) == i for i, k in enumerate(ordered))
+        assert M.count_range(100, 300) == sum(1 for k in ordered if 100 <= k < 300)
+        print(cls.__name__, len(M), M.select(0)[0], M.select(-1)[0], M.rank(250), M.count_range(None, 250))
+test_order_statistics()
+
+def test_split_join():
+    for cls in (treemap.AVLTreeMap, treemap.RedBlackTreeMap):
+        M = cls.from_sorted((k, str(k)) for k in range(0, 40, 2))
+        low, high = M.split(15)
+        print(cls.__name__, list(low), list(high))
+        M = cls.join(low, high)
+        print(len(M), len(low), M.rank(15), M.select(8))
+        U = M.union(cls.from_sorted([(1, 'one'), (2, 'two'), (41, 'forty-one')]))
+        print(U.select(0), U.select(2), U.select(-1), len(U))
+test_split_join()
+
+def test_aggregate():
+    sums = AggregateTreeMap()
+    lows = AggregateTreeMap(min, float('inf'))
+    for t, reading in enumerate([5, 3, 8, 1, 9, 2, 7, 4]):
+        sums[t * 10] = reading
+        lows[t * 10] = reading
+    del sums[30]
+    sums[40] = 10
+    print(sums.aggregate(10, 50), sums.aggregate(None, 25), sums.total(), lows.aggregate(35, None))
+test_aggregate()
+
+def test_intervals():
+    T = IntervalTreeMap()
+    for start, end, name in [(9, 12, 'a'), (1, 4, 'b'), (3, 8, 'c'), (10, 15, 'd'), (6, 7, 'e')]:
+        T.insert(start, end, name)
+    print(T.overlapping(4, 10), T.stabbing(3))
+    T.remove(3, 8)
+    print(T.overlapping_batch([(0, 2), (7, 11)]), T.stabbing_batch([6, 12]))
+test_intervals()
+
+def test_persistent():
+    M = PersistentTreeMap()
+    for k in range(10):
+        M[k] = k * k
+    old = M.snapshot()
+    del M[3]
+    M[4] = 'four'
+    print(list(old.find_range(2, 6)), list(M.find_range(2, 6)))
+    print(old.find_ge(3), M.find_ge(3), len(old), len(M), len(M.updated(20, 0)))
+test_persistent()
+
+def test_skiplist():
+    M = SkipListMap.from_sorted([(k, str(k)) for k in range(0, 20, 3)], seed=1)
+    M[7] = 'seven'
+    del M[9]
+    p = M.find_position(8)
+    print(list(M), M.find_min(), M.find_max(), M.find_ge(8), M.find_lt(8))
+    print(p.key(), M.before(p).key(), M.after(p).key(), list(M.find_range(5, 16)))
+test_skiplist()
+
+def test_finger_search():
+    M = treemap.RedBlackTreeMap.from_sorted((k, k * k) for k in range(100))
+    M.finger_search = True
+    print(M[40], M[41], M[39], M.find_ge(42.5), M.items_between(43, 46))
+    c = M.cursor()
+    print(c.seek(10).key(), c.seek(12.5).key(), c.seek(7).key(), c.seek(200).valid())
+test_finger_search()
@@ -1,4 +1,5 @@
 from trees import tree
+from trees.arrayTree import ArrayBinaryTree
 
 def test_trees():
     T = tree.Tree()
@@ -28,4 +29,21 @@ def build_expression_tree(tokens):
             op = S.pop()
             left = S.pop()
             S.append(tree.ExpressionTree(op, left, right))
-    return S.pop()
\ No newline at end of file
+    return S.pop()
+
+
+def test_array_tree():
+    T = ArrayBinaryTree([5, 6, 7, 2, 3, 8, 9])
+    print(list(T.preorder()), list(T.postorder()), list(T.inorder()), list(T.breadthfirst()))
+    p = T.left(T.root1())
+    print(T.element(p), list(T.children(p)), T.parent(p), T.sibling(p), T.depth(4), T.height())
+test_array_tree()
+
+def test_deep_traversals():
+    T = tree.Tree()
+    p = T.add_root(0)
+    for j in range(1, 5000):
+        p = T.add_left(p, j) if j % 2 else T.add_right(p, j)
+    print(sum(1 for e in T.postorder()), next(iter(T.inorder())), [len(b) for b in T.batches('breadthfirst', 2000)])
+    print([q.element() for q in T.subtree_preorder(T.root1())][:5])
+test_deep_traversals()
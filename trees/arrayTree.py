@@ -0,0 +1,172 @@
+class ArrayBinaryTree:
+    """Complete binary tree stored in level order in a Python list
+
+    Positions are plain integer indices: the root is 0 and the children of
+    position p are 2p+1 and 2p+2, so the tree keeps no nodes or links and
+    navigation is index arithmetic. Elements are added and removed at the
+    end of the level order, which keeps the tree complete.
+    """
+
+    def __init__(self, elements=()):
+        """Create a tree holding elements in level order"""
+        self.data = list(elements)
+
+    def __len__(self):
+        """Return the total number of elements in the tree"""
+        return len(self.data)
+
+    def validate(self, p):
+        """Return p if it is a position of the tree"""
+        if not isinstance(p, int):
+            raise TypeError('p must be an integer position')
+        if not 0 <= p < len(self.data):
+            raise ValueError('p is not a position of this tree')
+        return p
+
+    def element(self, p):
+        """Return the element stored at position p"""
+        return self.data[self.validate(p)]
+
+    def root1(self):
+        """Return the root position of the tree (or None if empty)"""
+        return 0 if self.data else None
+
+    def parent(self, p):
+        """Return the position of p's parent (or None if p is the root)"""
+        p = self.validate(p)
+        return (p - 1) // 2 if p > 0 else None
+
+    def left(self, p):
+        """Return the position of p's left child (or None)"""
+        child = 2 * self.validate(p) + 1
+        return child if child < len(self.data) else None
+
+    def right(self, p):
+        """Return the position of p's right child (or None)"""
+        child = 2 * self.validate(p) + 2
+        return child if child < len(self.data) else None
+
+    def is_root(self, p):
+        """Return True if position p represents the root of the tree"""
+        return self.validate(p) == 0
+
+    def is_leaf(self, p):
+        """Return True if position p does not have any children"""
+        return 2 * self.validate(p) + 1 >= len(self.data)
+
+    def is_empty(self):
+        """Return True if the tree is empty"""
+        return len(self.data) == 0
+
+    def depth(self, p):
+        """Return the number of levels separating position p from the root"""
+        return (self.validate(p) + 1).bit_length() - 1
+
+    def height(self, p=None):
+        """Return the height of the subtree rooted at position p
+        if p is None, return the height of the entire tree"""
+        if p is None:
+            p = self.root1()
+        p = self.validate(p)
+        height = 0
+        while 2 * p + 1 < len(self.data):
+            p = 2 * p + 1
+            height += 1
+        return height
+
+    def sibling(self, p):
+        """Return the position of p's sibling (or None)"""
+        if self.validate(p) == 0:
+            return None
+        other = p + 1 if p % 2 else p - 1
+        return other if other < len(self.data) else None
+
+    def children(self, p):
+        """Generate an iteration of positions representing p's children"""
+        child = 2 * self.validate(p) + 1
+        for c in (child, child + 1):
+            if c < len(self.data):
+                yield c
+
+    def num_children(self, p):
+        """Return the number of children of position p"""
+        return max(0, min(2, len(self.data) - 2 * self.validate(p) - 1))
+
+    def add(self, e):
+        """Add e at the next position of the level order and return that position"""
+        self.data.append(e)
+        return len(self.data) - 1
+
+    def add_root(self, e):
+        """Place element e at the root of an empty tree and return its position"""
+        if self.data:
+            raise ValueError('Root exists')
+        return self.add(e)
+
+    def replace(self, p, e):
+        """Replace the element at position p with e, and return old element"""
+        old = self.data[self.validate(p)]
+        self.data[p] = e
+        return old
+
+    def delete_last(self):
+        """Remove and return the element at the last position of the level order"""
+        if not self.data:
+            raise ValueError('Tree is empty')
+        return self.data.pop()
+
+    def positions(self):
+        """Generate an iteration of the tree's positions in level order"""
+        return iter(range(len(self.data)))
+
+    def preorder(self):
+        """Generate a preorder iteration of elements in the tree"""
+        data = self.data
+        n = len(data)
+        stack = [0] if n else []
+        while stack:
+            p = stack.pop()
+            yield data[p]
+            if 2 * p + 2 < n:
+                stack.append(2 * p + 2)
+            if 2 * p + 1 < n:
+                stack.append(2 * p + 1)
+
+    def postorder(self):
+        """Generate a postorder iteration of elements in the tree"""
+        data = self.data
+        n = len(data)
+        p = 0 if n else -1
+        previous = -1
+        while p >= 0:
+            parent = (p - 1) // 2 if p > 0 else -1
+            child = 2 * p + 1
+            if previous == parent and child < n:
+                previous, p = p, child
+            elif previous != child + 1 and previous != parent and child + 1 < n:
+                previous, p = p, child + 1
+            else:
+                yield data[p]
+                previous, p = p, parent
+
+    def inorder(self):
+        """Generate an inorder iteration of elements in the tree"""
+        data = self.data
+        n = len(data)
+        p = 0
+        while 2 * p + 1 < n:
+            p = 2 * p + 1
+        while 0 <= p < n:
+            yield data[p]
+            if 2 * p + 2 < n:
+                p = 2 * p + 2
+                while 2 * p + 1 < n:
+                    p = 2 * p + 1
+            else:
+                while p > 0 and p % 2 == 0:
+                    p = (p - 1) // 2
+                p = (p - 1) // 2 if p > 0 else -1
+
+    def breadthfirst(self):
+        """Generate a breadth-first iteration of the elements of the tree"""
+        return iter(self.data)
@@ -1,5 +1,3 @@
-from linkedlists.linkedQueue import LinkedQueue
-
 class Tree:
     """Abstract base class representing a tree structure"""
 
@@ -207,58 +205,113 @@ class Tree:
             t2.root = None
             t2.size = 0
 
+    def preorder_nodes(self, node):
+        """Generate the nodes of node's subtree in preorder, using an explicit stack"""
+        stack = [node] if node is not None else []
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+    def postorder_nodes(self, node):
+        """Generate the nodes of node's subtree in postorder, using an explicit stack"""
+        stack = []
+        last = None
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                top = stack[-1]
+                if top.right is not None and top.right is not last:
+                    node = top.right
+                else:
+                    last = stack.pop()
+                    yield last
+
+    def inorder_nodes(self, node):
+        """Generate the nodes of node's subtree in inorder, using an explicit stack"""
+        stack = []
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                yield node
+                node = node.right
+
+    def breadthfirst_nodes(self, node):
+        """Generate the nodes of node's subtree level by level"""
+        level = [node] if node is not None else []
+        while level:
+            below = []
+            for node in level:
+                yield node
+                if node.left is not None:
+                    below.append(node.left)
+                if node.right is not None:
+                    below.append(node.right)
+            level = below
+
     def preorder(self):
-        """Generate a preorder iteration of positions in the tree"""
-        if not self.is_empty():
-            for p in self.subtree_preorder(self.root1()):
-                yield p.node.element
+        """Generate a preorder iteration of elements in the tree"""
+        for node in self.preorder_nodes(self.root):
+            yield node.element
 
     def subtree_preorder(self, p):
         """Generate a preorder iteration of positions in subtree rooted at p"""
-        yield p
-        for c in self.children(p):
-            for other in self.subtree_preorder(c):
-                yield other
+        for node in self.preorder_nodes(self.validate(p)):
+            yield self.make_position(node)
 
     def postorder(self):
-        """Generate a preorder iteration of positions in the tree"""
-        if not self.is_empty():
-            for p in self.subtree_postorder(self.root1()):
-                yield p.node.element
+        """Generate a postorder iteration of elements in the tree"""
+        for node in self.postorder_nodes(self.root):
+            yield node.element
 
     def subtree_postorder(self, p):
-        """Generate a preorder iteration of positions in subtree rooted at p"""
-        for c in self.children(p):
-            for other in self.subtree_postorder(c):
-                yield other
-        yield p
+        """Generate a postorder iteration of positions in subtree rooted at p"""
+        for node in self.postorder_nodes(self.validate(p)):
+            yield self.make_position(node)
 
     def inorder(self):
-        """Generate an inorder iteration of positions in the tree"""
-        if not self.is_empty():
-            for p in self.subtree_inorder(self.root1()):
-                yield p.element()
+        """Generate an inorder iteration of elements in the tree"""
+        for node in self.inorder_nodes(self.root):
+            yield node.element
 
     def subtree_inorder(self, p):
-        """Generate an inorder iteration of positions in the tree."""
-        if self.left(p) is not None:
-            for other in self.subtree_inorder(self.left(p)):
-                yield other
-        yield p
-        if self.right(p) is not None:
-            for other in self.subtree_inorder(self.right(p)):
-                yield other
+        """Generate an inorder iteration of positions in subtree rooted at p"""
+        for node in self.inorder_nodes(self.validate(p)):
+            yield self.make_position(node)
 
     def breadthfirst(self):
-        """Generate a breadth-first iteration of the positions of the tree"""
-        if not self.is_empty():
-            fringe = LinkedQueue()
-            fringe.enqueue(self.root1())
-            while not fringe.is_empty():
-                p = fringe.dequeue()
-                yield p.node.element
-                for c in self.children(p):
-                    fringe.enqueue(c)
+        """Generate a breadth-first iteration of the elements of the tree"""
+        for node in self.breadthfirst_nodes(self.root):
+            yield node.element
+
+    def subtree_breadthfirst(self, p):
+        """Generate a breadth-first iteration of positions in subtree rooted at p"""
+        for node in self.breadthfirst_nodes(self.validate(p)):
+            yield self.make_position(node)
+
+    def batches(self, order='preorder', size=1000):
+        """Generate lists of up to size elements of the tree in the given order:
+        'preorder', 'postorder', 'inorder' or 'breadthfirst'"""
+        if order not in ('preorder', 'postorder', 'inorder', 'breadthfirst'):
+            raise ValueError('Unknown traversal order: ' + repr(order))
+        if size < 1:
+            raise ValueError('size must be positive')
+        batch = []
+        for node in getattr(self, order + '_nodes')(self.root):
+            batch.append(node.element)
+            if len(batch) == size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
 
 
 class ExpressionTree(Tree):